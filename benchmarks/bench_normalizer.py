@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Normalizer.to_dict on large nested payloads.
+
+Compares the type-dispatched, iterative normalizer against the previous recursive
+implementation (inlined below) on plain JSON payloads and on payloads of dataclasses.
+
+Usage: python benchmarks/bench_normalizer.py [--sizes 100 10000 100000]
+"""
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import asdict, dataclass, is_dataclass
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from utils.normalizer import Normalizer
+
+
+@dataclass
+class Segment:
+    from_airport: str
+    to_airport: str
+    duration: int
+
+
+@dataclass
+class Flight:
+    price: float
+    airline: str
+    segments: list
+
+
+def legacy_to_dict(obj):
+    """Normalizer.to_dict before type dispatch (plugins omitted)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, dict):
+        return obj
+    if isinstance(obj, str):
+        try:
+            return json.loads(obj)
+        except Exception:
+            pass
+    if isinstance(obj, list):
+        return [legacy_to_dict(item) for item in obj]
+    if hasattr(obj, "__dict__") and obj.__dict__:
+        return dict(obj.__dict__)
+    return obj
+
+
+def make_plain(size: int) -> dict:
+    return {"flights": [{"price": 100.0 + i, "airline": "XX", "segments": [
+        {"from_airport": "TPE", "to_airport": "MYJ", "duration": 120}]} for i in range(size)]}
+
+
+def make_dataclasses(size: int) -> list:
+    return [Flight(100.0 + i, "XX", [Segment("TPE", "MYJ", 120)]) for i in range(size)]
+
+
+def time_per_call(fn, payload) -> float:
+    """Return the best per-call time in milliseconds"""
+    best = min(timeit.repeat(lambda: fn(payload), number=1, repeat=5))
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'payload':>12} {'items':>8} {'legacy ms':>12} {'dispatch ms':>12}")
+    for size in args.sizes:
+        for name, payload in (("plain", make_plain(size)), ("dataclasses", make_dataclasses(size))):
+            assert json.dumps(Normalizer.to_dict(payload)) == json.dumps(legacy_to_dict(payload))
+            legacy_ms = time_per_call(legacy_to_dict, payload)
+            dispatch_ms = time_per_call(Normalizer.to_dict, payload)
+            print(f"{name:>12} {size:>8} {legacy_ms:>12.2f} {dispatch_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
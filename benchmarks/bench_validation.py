@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: validate() cost per call on large flight_data arrays.
+
+Compares the compiled validator produced by ValidatorCompiler against the
+hand-written validate() of the checked-in FastFlightsToolV5 tool.
+
+Usage: python benchmarks/bench_validation.py [--sizes 10 1000 100000]
+"""
+import argparse
+import importlib.util
+import json
+import sys
+import timeit
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from generators.validator_compiler import ValidatorCompiler
+
+TOOL_DIR = project_root / "generated_tools" / "fastflightstoolv5"
+
+
+def load_legacy_tool():
+    """Load the checked-in tool whose validate() predates the compiler"""
+    spec = importlib.util.spec_from_file_location("fastflightstoolv5_bench", TOOL_DIR / "tool.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.FastFlightsToolV5()
+
+
+def make_params(size: int) -> dict:
+    return {
+        "flight_data": [
+            {"date": "2025-01-01", "from_airport": "TPE", "to_airport": "MYJ"} for _ in range(size)
+        ],
+        "trip": "one-way",
+        "seat": "economy",
+        "passengers": {"adults": 2, "children": 1, "infants_in_seat": 0, "infants_on_lap": 0},
+        "fetch_mode": "common"
+    }
+
+
+def time_per_call(fn, params) -> float:
+    """Return the best per-call time in microseconds"""
+    number = max(1, 20000 // max(1, len(params["flight_data"])))
+    best = min(timeit.repeat(lambda: fn(params), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000, 100000])
+    args = parser.parse_args()
+
+    with open(TOOL_DIR / "metadata.json") as f:
+        schema = json.load(f)["mcp_schema"]["input_schema"]
+
+    compiled = ValidatorCompiler().compile(schema)
+    legacy = load_legacy_tool().validate
+
+    print(f"{'items':>8} {'legacy us/call':>16} {'compiled us/call':>18} {'compiled ns/item':>18}")
+    for size in args.sizes:
+        params = make_params(size)
+        assert compiled(params) == [] and legacy(params)
+        legacy_us = time_per_call(legacy, params)
+        compiled_us = time_per_call(compiled, params)
+        print(f"{size:>8} {legacy_us:>16.2f} {compiled_us:>18.2f} {compiled_us * 1000 / size:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
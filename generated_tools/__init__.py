@@ -0,0 +1,48 @@
+"""
+Generated MCP tools.
+
+Tool classes are resolved lazily: accessing ``<package>.WeatherTool`` imports only
+``<package>.weathertool.tool``, so importing one tool out of many costs only that tool.
+"""
+import importlib
+import json
+from pathlib import Path
+
+_PACKAGE_DIR = Path(__file__).parent
+_registry_directories = None
+
+
+def _tool_directory(name):
+    """Directory of the tool class name: by naming convention, else from tool_registry.json"""
+    global _registry_directories
+    if (_PACKAGE_DIR / name.lower() / "tool.py").exists():
+        return name.lower()
+    if _registry_directories is None:
+        try:
+            with open(_PACKAGE_DIR / "tool_registry.json", "r") as f:
+                tools = json.load(f).get("tools", {})
+        except (OSError, ValueError, AttributeError):
+            tools = {}
+        _registry_directories = {tool_name: info.get("directory", tool_name.lower())
+                                 for tool_name, info in tools.items() if isinstance(info, dict)}
+    return _registry_directories.get(name)
+
+
+def __getattr__(name):
+    directory = None if name.startswith("_") else _tool_directory(name)
+    if directory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{directory}.tool", __name__)
+    tool_class = getattr(module, name)
+    globals()[name] = tool_class
+    return tool_class
+
+
+def __dir__():
+    tool_names = []
+    try:
+        with open(_PACKAGE_DIR / "tool_registry.json", "r") as f:
+            tool_names = list(json.load(f).get("tools", {}))
+    except (OSError, ValueError, AttributeError):
+        pass
+    return sorted(set(globals()) | set(tool_names))
@@ -2,9 +2,10 @@
 Tool Generator - Main orchestrator for generating MCP tools from API descriptions
 """
 import os
+import re
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..llm.input_parser import InputParser
 from ..utils.sandbox import Sandbox
@@ -17,7 +18,11 @@ from ..generators.output_generator import OutputGenerator
 class ToolGenerator:
     """Main class that orchestrates the tool generation process"""
     
-    def __init__(self):
+    # Generation fails when a tool's cold import or validate() call is slower than this
+    DEFAULT_PERFORMANCE_BUDGET = {"import_ms": 1000.0, "validate_us": 500.0}
+    
+    def __init__(self, performance_budget: Optional[Dict[str, float]] = None):
+        self.performance_budget = {**self.DEFAULT_PERFORMANCE_BUDGET, **(performance_budget or {})}
         self.input_parser = InputParser()
         self.sandbox = Sandbox()
         self.normalizer = Normalizer()
@@ -117,6 +122,8 @@ class ToolGenerator:
                 "metadata": "metadata.json"
             },
             "mcp_schema": mcp_mapping,
+            "sample_response": normalized_response,
+            "runtime": self._default_runtime_config(parsed_data),
             "input_sources": {
                 "api_documentation_provided": True,
                 "documentation_length": len(api_documentation)
@@ -126,6 +133,16 @@ class ToolGenerator:
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
         
+        # Step 7: Import the compiled tool in the sandbox and check it against the performance budget
+        print("⏱️  Profiling generated tool...")
+        metadata["performance"] = self._profile_tool(
+            name, tool_class_path, self._sample_params(parsed_data, mcp_mapping.get('input_schema', {})))
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        self._check_performance_budget(name, metadata["performance"])
+        print(f"✅ Import {metadata['performance']['import_ms']:.1f} ms, "
+              f"validate {metadata['performance']['validate_us']:.1f} µs")
+        
         print(f"📁 Generated files:")
         print(f"  - {tool_class_path}")
         print(f"  - {wrapper_path}")
@@ -137,6 +154,94 @@ class ToolGenerator:
         print(f"🎉 Tool '{name}' generation completed successfully!")
         print(f"🤖 Enhanced with {parsed_data.get('llm_provider', 'LLM')} analysis (confidence: {parsed_data.get('confidence_score', 0.95):.1%})")
 
+    def _profile_tool(self, name: str, tool_class_path: Path, sample_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Measure cold import time and validate() latency of the generated tool in the sandbox"""
+        performance = self.sandbox.profile_tool(str(tool_class_path), name, sample_params)
+        performance["budget"] = dict(self.performance_budget)
+        performance["measured_at"] = self._get_current_timestamp()
+        return performance
+
+    def _check_performance_budget(self, name: str, performance: Dict[str, Any]) -> None:
+        """Raise when a measured number exceeds its budget; the tool is then not registered"""
+        exceeded = [f"{metric} {performance[metric]:.1f} > {limit:.1f}"
+                    for metric, limit in self.performance_budget.items()
+                    if limit is not None and performance.get(metric) is not None and performance[metric] > limit]
+        if exceeded:
+            raise RuntimeError(f"Tool '{name}' exceeds its performance budget: {', '.join(exceeded)}")
+
+    def _sample_params(self, parsed_data: Dict[str, Any], input_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Representative parameters for profiling validate(): the first usage example, else schema examples"""
+        for example in parsed_data.get('usage_examples') or []:
+            if isinstance(example, dict) and isinstance(example.get('parameters'), dict):
+                return example['parameters']
+        sample = {}
+        for param_name, param_info in input_schema.items():
+            if isinstance(param_info, dict):
+                value = param_info.get('example', param_info.get('default'))
+                if value is not None:
+                    sample[param_name] = value
+        return sample
+
+    def _default_runtime_config(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Default "runtime" section of metadata.json, read by the generated tool at import time"""
+        runtime_config = {
+            "timeout_seconds": 30,
+            "circuit_breaker": {
+                "enabled": True,
+                "failure_threshold": 5,
+                "recovery_timeout_seconds": 30,
+                "half_open_max_calls": 1
+            },
+            "rate_limit": self._default_rate_limit(parsed_data),
+            "cache": {
+                "enabled": False,
+                "ttl_seconds": 300,
+                "max_entries": 256,
+                "stale_while_revalidate_seconds": 0
+            }
+        }
+        if parsed_data.get('api_type') != 'python_package':
+            runtime_config["transport"] = {
+                "pool_maxsize": 32,
+                "compression": True,
+                "conditional_cache": {"enabled": True, "max_entries": 512}
+            }
+            runtime_config["response"] = {"stream": False, "project": False, "max_items": None}
+            if parsed_data.get('pagination'):
+                runtime_config["pagination"] = dict(parsed_data['pagination'], enabled=True, max_pages=10,
+                                                    max_items=1000, max_concurrency=4)
+        else:
+            runtime_config["workers"] = {
+                "enabled": False,
+                "pool_size": 2,
+                "max_calls_per_worker": 100,
+                "max_memory_growth_mb": 256,
+                "timeout_seconds": 60,
+                "startup_timeout_seconds": 60,
+                "prestart": False,
+                "preload": self._preload_modules(parsed_data)
+            }
+        return runtime_config
+
+    def _default_rate_limit(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Rate limit settings: enabled with the documented quota when the LLM found one"""
+        documented = parsed_data.get('rate_limit') or {}
+        return {
+            "enabled": bool(documented),
+            "requests_per_second": documented.get("requests_per_second", 10),
+            "burst": documented.get("burst"),
+            "shared": "thread",
+            "retry_on_429": 1
+        }
+
+    def _preload_modules(self, parsed_data: Dict[str, Any]) -> list:
+        """Modules imported up front by warm workers, taken from the main function's import statement"""
+        import_statement = parsed_data.get('main_function', {}).get('import_statement', '')
+        match = re.match(r"\s*(?:from\s+([\w.]+)\s+import|import\s+([\w.]+))", import_statement or '')
+        if match:
+            return [match.group(1) or match.group(2)]
+        return [parsed_data['package_name']] if parsed_data.get('package_name') else []
+
     def _create_mock_response(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a mock response based on parsed API information"""
         api_name = parsed_data.get('api_name', '').lower()
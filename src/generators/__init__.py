@@ -3,5 +3,6 @@ Code generation utilities for MCP tools.
 """
 
 from .output_generator import OutputGenerator
+from .validator_compiler import ValidatorCompiler
 
-__all__ = ['OutputGenerator'] 
\ No newline at end of file
+__all__ = ['OutputGenerator', 'ValidatorCompiler'] 
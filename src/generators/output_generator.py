@@ -1,8 +1,66 @@
 import json
-from typing import Dict, Any, Optional
+import pprint
+import py_compile
+from typing import Dict, Any, List, Optional
 import os
 from pathlib import Path
 
+from .validator_compiler import ValidatorCompiler
+
+RUNTIME_DIR = Path(__file__).parent / "runtime"
+RUNTIME_PACKAGE = "_runtime"
+
+# __init__.py of the generated tools directory: tool classes are imported on first attribute access
+TOOLS_PACKAGE_INIT = '''"""
+Generated MCP tools.
+
+Tool classes are resolved lazily: accessing ``<package>.WeatherTool`` imports only
+``<package>.weathertool.tool``, so importing one tool out of many costs only that tool.
+"""
+import importlib
+import json
+from pathlib import Path
+
+_PACKAGE_DIR = Path(__file__).parent
+_registry_directories = None
+
+
+def _tool_directory(name):
+    """Directory of the tool class name: by naming convention, else from tool_registry.json"""
+    global _registry_directories
+    if (_PACKAGE_DIR / name.lower() / "tool.py").exists():
+        return name.lower()
+    if _registry_directories is None:
+        try:
+            with open(_PACKAGE_DIR / "tool_registry.json", "r") as f:
+                tools = json.load(f).get("tools", {})
+        except (OSError, ValueError, AttributeError):
+            tools = {}
+        _registry_directories = {tool_name: info.get("directory", tool_name.lower())
+                                 for tool_name, info in tools.items() if isinstance(info, dict)}
+    return _registry_directories.get(name)
+
+
+def __getattr__(name):
+    directory = None if name.startswith("_") else _tool_directory(name)
+    if directory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{directory}.tool", __name__)
+    tool_class = getattr(module, name)
+    globals()[name] = tool_class
+    return tool_class
+
+
+def __dir__():
+    tool_names = []
+    try:
+        with open(_PACKAGE_DIR / "tool_registry.json", "r") as f:
+            tool_names = list(json.load(f).get("tools", {}))
+    except (OSError, ValueError, AttributeError):
+        pass
+    return sorted(set(globals()) | set(tool_names))
+'''
+
 class OutputGenerator:
     """
     Generates MCP-compatible JSON files and Python tool classes from validated, mapped responses.
@@ -55,9 +113,19 @@ class OutputGenerator:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
         
+        # Generated tools live in an importable package and share its _runtime subpackage
+        tools_root = Path(output_file).resolve().parent.parent
+        self.write_tools_package(str(tools_root))
+        self.write_runtime_package(str(tools_root))
+        self._write_if_changed(Path(output_file).parent / "__init__.py",
+                               f'"""Generated MCP tool package: {name}"""\n')
+        
         # Write the tool class file
         with open(output_file, 'w') as f:
             f.write(tool_code)
+        
+        # Catch template interpolation errors now rather than when the server loads the tool
+        self.compile_module(output_file)
     
     def _generate_python_package_tool(self, name: str, description: str, parameters_schema: Dict[str, Any],
                                     sample_response: Dict[str, Any], parsed_data: Dict[str, Any]) -> str:
@@ -80,17 +148,21 @@ class OutputGenerator:
         # Generate validation code
         validation_code = self._generate_validation_code(parameters_schema)
         
-        # Format sample response comment
-        sample_response_comment = self._format_sample_response_comment(sample_response)
-        
         tool_code = f'''"""
 Generated MCP Tool: {name}
 Description: {description}
 
 Auto-generated from API documentation analysis.
 """
-import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
+
+try:
+    from .._runtime import GeneratedTool, ToolRuntime, error_response
+except ImportError:  # loaded by file path rather than as part of the tools package
+    from _runtime import GeneratedTool, ToolRuntime, error_response
+
+RUNTIME = ToolRuntime(__file__, upstream="package:{package_name}")
+
 
 def call_{function_name.lower()}({self._generate_function_signature(parameters_schema)}):
     """
@@ -107,48 +179,32 @@ def call_{function_name.lower()}({self._generate_function_signature(parameters_s
 {response_transform}
         
     except ImportError:
-        return {{
-            "error": "{package_name} package not installed",
-            "message": "Please install {package_name}: pip install {package_name}"
-        }}
+        return error_response("{package_name} package not installed",
+                              "Please install {package_name}: pip install {package_name}")
     except Exception as e:
-        return {{
-            "error": str(e),
-            "message": f"Failed to get data: {{str(e)}}"
-        }}
+        return error_response(str(e), f"Failed to get data: {{str(e)}}")
 
+{validation_code}
 
-class {name}:
+class {name}(GeneratedTool):
     """MCP Tool for {description}"""
     name = "{name}"
     description = "{description}"
-    parameters_schema = {json.dumps(parameters_schema, indent=4)}
+    parameters_schema = {pprint.pformat(parameters_schema, indent=4, sort_dicts=False)}
+    runtime = RUNTIME
+    _validator = staticmethod(_validate_params)
 
-    def run(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the tool with given parameters"""
+    def run(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Execute the tool with given parameters, within timeout seconds when given"""
         try:
 {param_extraction}
             
-            # Call the function
-            result = call_{function_name.lower()}({self._generate_function_args(parameters_schema)})
+            call_kwargs = dict({self._generate_function_args(parameters_schema)})
             
-            return result
+            # Call the function through the shared runtime (deadline, circuit breaker, cache, worker pool)
+            return self.runtime.invoke(call_{function_name.lower()}, call_kwargs, timeout=timeout)
         except Exception as e:
-            return {{
-                "error": str(e),
-                "message": f"Failed to execute {name}: {{str(e)}}"
-            }}
-
-    def validate(self, params: Dict[str, Any]) -> bool:
-        """Validate input parameters"""
-        if not isinstance(params, dict):
-            return False
-        
-{validation_code}
-        
-        return True
-
-{sample_response_comment}
+            return error_response(str(e), f"Failed to execute {name}: {{str(e)}}")
 '''
         return tool_code
     
@@ -169,18 +225,21 @@ class {name}:
         # Generate validation code
         validation_code = self._generate_validation_code(parameters_schema)
         
-        # Format sample response comment
-        sample_response_comment = self._format_sample_response_comment(sample_response)
-        
         tool_code = f'''"""
 Generated MCP Tool: {name}
 Description: {description}
 
 Auto-generated from API documentation analysis.
 """
-import requests
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    from .._runtime import GeneratedTool, ToolRuntime, error_response
+except ImportError:  # loaded by file path rather than as part of the tools package
+    from _runtime import GeneratedTool, ToolRuntime, error_response
+
+RUNTIME = ToolRuntime(__file__)
+
 
 def call_api({self._generate_function_signature(parameters_schema)}):
     """
@@ -188,54 +247,106 @@ def call_api({self._generate_function_signature(parameters_schema)}):
     Generated from LLM analysis of API documentation
     """
     try:
-        {api_call}
+{api_call}
+        
+        if RUNTIME.pagination is not None:
+            return RUNTIME.fetch_all_pages(url, params, headers)
         
-        response = requests.get(url, params=params, headers=headers)
+        response = RUNTIME.transport.get(url, params=params, headers=headers,
+                                         stream=RUNTIME.stream_responses)
         response.raise_for_status()
         
-        return response.json()
+        return RUNTIME.parse_response(response)
         
     except Exception as e:
-        return {{
-            "error": str(e),
-            "message": f"Failed to call API: {{str(e)}}"
-        }}
+        return error_response(str(e), f"Failed to call API: {{str(e)}}")
 
+{validation_code}
 
-class {name}:
+class {name}(GeneratedTool):
     """MCP Tool for {description}"""
     name = "{name}"
     description = "{description}"
-    parameters_schema = {json.dumps(parameters_schema, indent=4)}
+    parameters_schema = {pprint.pformat(parameters_schema, indent=4, sort_dicts=False)}
+    runtime = RUNTIME
+    _validator = staticmethod(_validate_params)
 
-    def run(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the tool with given parameters"""
+    def run(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Execute the tool with given parameters, within timeout seconds when given"""
         try:
-            {param_extraction}
+{param_extraction}
             
-            # Call the API
-            result = call_api({self._generate_function_args(parameters_schema)})
+            call_kwargs = dict({self._generate_function_args(parameters_schema)})
             
-            return result
+            # Call the API through the shared runtime (deadline, cache; breaker per host in the transport)
+            return self.runtime.invoke(call_api, call_kwargs, timeout=timeout)
         except Exception as e:
-            return {{
-                "error": str(e),
-                "message": f"Failed to execute {name}: {{str(e)}}"
-            }}
-
-    def validate(self, params: Dict[str, Any]) -> bool:
-        """Validate input parameters"""
-        if not isinstance(params, dict):
-            return False
-        
-        {validation_code}
-        
-        return True
-
-{sample_response_comment}
+            return error_response(str(e), f"Failed to execute {name}: {{str(e)}}")
 '''
         return tool_code
     
+    def write_tools_package(self, tools_root: str) -> Path:
+        """
+        Write <tools_root>/__init__.py, which makes the tools directory a package whose
+        tool classes are imported lazily on attribute access.
+        
+        Args:
+            tools_root: Directory containing the generated tool directories
+            
+        Returns:
+            Path of the package __init__.py
+        """
+        init_file = Path(tools_root) / "__init__.py"
+        self._write_if_changed(init_file, TOOLS_PACKAGE_INIT)
+        self.compile_module(str(init_file))
+        return init_file
+    
+    @staticmethod
+    def _write_if_changed(path: Path, content: str) -> None:
+        """Write content unless the file already holds it (keeps mtimes and .pyc files valid)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists() or path.read_text() != content:
+            path.write_text(content)
+    
+    def write_runtime_package(self, tools_root: str) -> Path:
+        """
+        Copy the shared runtime into <tools_root>/_runtime so generated tools can import it.
+        Files are only rewritten when their content changed.
+        
+        Args:
+            tools_root: Directory containing the generated tool directories
+            
+        Returns:
+            Path of the runtime package directory
+        """
+        runtime_dir = Path(tools_root) / RUNTIME_PACKAGE
+        runtime_dir.mkdir(parents=True, exist_ok=True)
+        for source_file in sorted(RUNTIME_DIR.glob("*.py")):
+            target_file = runtime_dir / source_file.name
+            self._write_if_changed(target_file, source_file.read_text())
+            self.compile_module(str(target_file))
+        return runtime_dir
+    
+    @staticmethod
+    def compile_module(source_file: str) -> str:
+        """
+        Byte-compile a generated module and write its .pyc next to it (__pycache__),
+        so the first import does not pay for compilation.
+        
+        Args:
+            source_file: Path of the Python module
+            
+        Returns:
+            Path of the written .pyc file
+            
+        Raises:
+            ValueError: If the module does not compile
+        """
+        try:
+            return py_compile.compile(source_file, doraise=True)
+        except py_compile.PyCompileError as e:
+            raise ValueError(f"Generated module {source_file} does not compile: {e.msg}") from e
+    
     def _generate_function_signature(self, parameters_schema: Dict[str, Any]) -> str:
         """Generate function signature from parameters schema"""
         params = []
@@ -384,46 +495,8 @@ class {name}:
         return f"{url_code}\n{params_code}\n{auth_code}"
     
     def _generate_validation_code(self, parameters_schema: Dict[str, Any]) -> str:
-        """Generate validation code for parameters"""
-        validations = []
-        
-        for param_name, param_info in parameters_schema.items():
-            is_required = param_info.get('required', True)
-            param_type = param_info.get('type', 'string')
-            enum_values = param_info.get('enum')
-            
-            if is_required:
-                validations.append(f"        # Check {param_name}")
-                validations.append(f"        {param_name} = params.get('{param_name}')")
-                
-                if param_type == 'array':
-                    validations.append(f"        if not {param_name} or not isinstance({param_name}, list) or len({param_name}) == 0:")
-                    validations.append("            return False")
-                    
-                    # Validate array items if structure is defined
-                    if 'class_structure' in param_info:
-                        validations.append(f"        for item in {param_name}:")
-                        validations.append("            if not isinstance(item, dict):")
-                        validations.append("                return False")
-                        
-                        class_structure = param_info.get('class_structure', {})
-                        required_fields = list(class_structure.keys())
-                        validations.append(f"            if not all(key in item for key in {required_fields}):")
-                        validations.append("                return False")
-                        
-                elif param_type == 'object':
-                    validations.append(f"        if not {param_name} or not isinstance({param_name}, dict):")
-                    validations.append("            return False")
-                    
-                elif param_type == 'string':
-                    validations.append(f"        if not {param_name} or not isinstance({param_name}, str):")
-                    validations.append("            return False")
-                    
-                    if enum_values:
-                        validations.append(f"        if {param_name} not in {enum_values}:")
-                        validations.append("            return False")
-        
-        return "\n".join(validations) if validations else "        # No specific validation required"
+        """Generate the compiled module-level validator for the parameters schema"""
+        return ValidatorCompiler("_validate_params").generate_source(parameters_schema)
     
     def _get_python_type(self, json_type: str) -> str:
         """Convert JSON schema type to Python type hint"""
@@ -450,15 +523,6 @@ class {name}:
         else:
             return '""'
     
-    def _format_sample_response_comment(self, sample_response: Dict[str, Any]) -> str:
-        """Format sample response as a proper Python comment"""
-        response_json = json.dumps(sample_response, indent=2)
-        lines = response_json.split('\n')
-        comment_lines = ['# Sample response structure based on API analysis:']
-        for line in lines:
-            comment_lines.append(f'# {line}')
-        return '\n'.join(comment_lines)
-
     def generate_wrapper(self, tool_name: str, tool_class_path: Path, output_file: str) -> None:
         """
         Generate a simple wrapper function for the tool (decoupled from src)
@@ -474,16 +538,23 @@ class {name}:
 Wrapper for {tool_name}
 Provides a simple function interface for the MCP tool
 """
-import sys
-import os
-from pathlib import Path
+try:
+    from .{class_module} import {tool_name}
+except ImportError:  # run as a script or loaded by file path rather than as part of the tools package
+    import sys
+    from pathlib import Path
+
+    tools_root = Path(__file__).resolve().parent.parent
+    if str(tools_root) not in sys.path:
+        sys.path.insert(0, str(tools_root))
 
-# Add the tool directory to the path
-tool_dir = Path(__file__).parent
-if str(tool_dir) not in sys.path:
-    sys.path.insert(0, str(tool_dir))
+    from _runtime.loader import load_tool_class
+
+    {tool_name} = load_tool_class(__file__, "{tool_name}", "{class_module}")
+
+# Tool instances are stateless; every call shares this one
+_TOOL = {tool_name}()
 
-from {class_module} import {tool_name}
 
 def run_{tool_name.lower()}(**kwargs):
     """
@@ -495,12 +566,24 @@ def run_{tool_name.lower()}(**kwargs):
     Returns:
         Result from the tool execution
     """
-    tool = {tool_name}()
-    
-    if not tool.validate(kwargs):
+    if not _TOOL.validate(kwargs):
         raise ValueError(f"Invalid parameters for {tool_name}: {{kwargs}}")
     
-    return tool.run(kwargs)
+    return _TOOL.run(kwargs)
+
+
+def run_{tool_name.lower()}_many(params_list, max_concurrency=8):
+    """
+    Run {tool_name} over many parameter sets concurrently
+    
+    Args:
+        params_list: List of parameter dicts
+        max_concurrency: Maximum number of concurrent executions
+        
+    Returns:
+        One {{"ok": ..., "result"/"error": ...}} entry per parameter set, in input order
+    """
+    return _TOOL.run_many(params_list, max_concurrency=max_concurrency)
 
 # Example usage:
 if __name__ == "__main__":
@@ -517,4 +600,5 @@ if __name__ == "__main__":
         
         # Write the wrapper file
         with open(output_file, 'w') as f:
-            f.write(wrapper_code) 
\ No newline at end of file
+            f.write(wrapper_code)
+        self.compile_module(output_file) 
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+Shared runtime for generated MCP tools.
+
+OutputGenerator copies this package next to the generated tools as ``_runtime``;
+generated tool modules stay thin and import transport, caching, validation and
+error shaping from it. The package must stay self-contained: standard library
+only (``requests`` is imported lazily by the HTTP transport) and no imports from
+the rest of ``src``.
+"""
+from .base import GeneratedTool, ToolRuntime
+from .errors import error_response
+
+RUNTIME_VERSION = "1.0"
+
+__all__ = ['GeneratedTool', 'ToolRuntime', 'error_response', 'RUNTIME_VERSION']
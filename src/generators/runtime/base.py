@@ -0,0 +1,218 @@
+"""
+Base class and per-tool runtime state for generated tools.
+"""
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import load_tool_metadata
+from .resilience import BREAKERS, current_deadline, deadline_scope, remaining_time
+
+
+class ToolRuntime:
+    """
+    Runtime state of one generated tool, configured from the "runtime" section of its metadata.json:
+    response cache, warm worker pool (python_package tools), pooled HTTP transport and
+    streaming response projection (REST tools). Optional components are only imported when enabled.
+    """
+
+    def __init__(self, tool_file: str, upstream: Optional[str] = None):
+        """
+        Args:
+            tool_file: Path of the generated tool module (its metadata.json is read)
+            upstream: Circuit breaker key for tools that do not call through the HTTP transport
+                      (python_package tools); REST tools get one breaker per host from the transport
+        """
+        self.tool_file = str(Path(tool_file).resolve())
+        self.upstream = upstream
+        metadata = load_tool_metadata(self.tool_file)
+        runtime_config = metadata.get("runtime")
+        self.config = runtime_config if isinstance(runtime_config, dict) else {}
+        self.cache = None
+        self.worker_pool = None
+        self._transport = None
+
+        cache_config = self.config.get("cache")
+        if cache_config and cache_config.get("enabled"):
+            from .cache import ResponseCache
+            self.cache = ResponseCache.from_config(cache_config)
+
+        workers_config = self.config.get("workers")
+        if workers_config and workers_config.get("enabled"):
+            from .workers import WorkerPool
+            # Workers import tool.py by path and need this package importable as _runtime
+            tools_root = os.path.dirname(os.path.dirname(self.tool_file))
+            self.worker_pool = WorkerPool.from_config(self.tool_file, workers_config, python_path=[tools_root])
+
+        self.timeout_seconds = self.config.get("timeout_seconds")
+        breaker_config = self.config.get("circuit_breaker")
+        self.breaker_config = breaker_config if breaker_config and breaker_config.get("enabled") else None
+        rate_limit_config = self.config.get("rate_limit")
+        self.rate_limit_config = rate_limit_config if rate_limit_config and rate_limit_config.get("enabled") else None
+
+        pagination_config = self.config.get("pagination")
+        self.pagination = pagination_config if pagination_config and pagination_config.get("enabled") else None
+
+        response_config = self.config.get("response") or {}
+        self.stream_responses = bool(response_config.get("stream"))
+        self.max_items = response_config.get("max_items")
+        self.projection = self._response_projection(response_config.get("project"),
+                                                    metadata.get("mcp_schema") or {})
+
+    @staticmethod
+    def _response_projection(project, mcp_schema: Dict[str, Any]):
+        """
+        Fields kept from REST responses: an explicit list of dotted paths, or with project=true
+        the fields declared by the tool's output schema, falling back to its field mapping.
+        """
+        if not project:
+            return None
+        from .streaming import projection_from_paths, projection_from_schema
+        if isinstance(project, list):
+            return projection_from_paths(project)
+        projection = projection_from_schema(mcp_schema.get("output_schema"))
+        if projection is None and isinstance(mcp_schema.get("field_mapping"), dict):
+            projection = projection_from_paths(mcp_schema["field_mapping"].values())
+        return projection
+
+    @property
+    def transport(self):
+        """Pooled HTTP transport, created on first use"""
+        if self._transport is None:
+            from .transport import HttpTransport
+            self._transport = HttpTransport(self.config.get("transport"), timeout_seconds=self.timeout_seconds,
+                                            breaker_config=self.breaker_config,
+                                            rate_limit_config=self.rate_limit_config,
+                                            cache_dir=os.path.join(os.path.dirname(self.tool_file), ".http_cache"))
+        return self._transport
+
+    def parse_response(self, response) -> Any:
+        """Decode a REST response, streaming and projecting it when the "response" section asks for it"""
+        if not self.stream_responses and self.projection is None and self.max_items is None:
+            return response.json()
+        from .streaming import read_json
+        return read_json(response, self.projection, self.max_items, stream=self.stream_responses)
+
+    def fetch_all_pages(self, url: str, params: Dict[str, Any], headers: Dict[str, str]) -> Any:
+        """
+        GET every page of a paginated endpoint (up to the configured limits) and return the
+        first page with its items replaced by the merged items of all pages
+        """
+        from .pagination import Paginator
+
+        deadline = current_deadline()
+
+        def fetch(page_params, page_url):
+            # Pages may be fetched on pool threads; carry the caller's deadline over to them
+            with deadline_scope(deadline.remaining() if deadline is not None else None):
+                if page_url:
+                    response = self.transport.get(page_url, headers=headers)
+                else:
+                    response = self.transport.get(url, params={**params, **page_params}, headers=headers)
+            response.raise_for_status()
+            return response.json(), response.links.get("next", {}).get("url")
+
+        paginator = Paginator(self.pagination)
+        result = paginator.collect(fetch)
+        if self.projection is not None or self.max_items is not None:
+            from .streaming import project
+            result = project(result, self.projection, self.max_items)
+        if isinstance(result, dict):
+            result["_pagination"] = {"pages": paginator.pages_fetched, "complete": paginator.complete}
+        return result
+
+    def invoke(self, function: Callable[..., Any], call_kwargs: Dict[str, Any],
+               timeout: Optional[float] = None) -> Any:
+        """
+        Call function(**call_kwargs) under a deadline of timeout seconds (default: the "timeout_seconds"
+        runtime setting), serving repeated arguments from the response cache and running the call
+        in the warm worker pool when those are enabled.
+        """
+        with deadline_scope(self.timeout_seconds if timeout is None else timeout):
+            if self.cache is not None:
+                return self.cache.get_or_call(call_kwargs, lambda: self._call(function, call_kwargs))
+            return self._call(function, call_kwargs)
+
+    def _call(self, function: Callable[..., Any], call_kwargs: Dict[str, Any]) -> Any:
+        if self.upstream and self.rate_limit_config is not None:
+            from .ratelimit import LIMITERS
+            LIMITERS.get(self.upstream, self.rate_limit_config).acquire(timeout=remaining_time())
+        breaker = None
+        if self.upstream and self.breaker_config is not None:
+            breaker = BREAKERS.get(self.upstream, self.breaker_config)
+            breaker.before_call()
+        try:
+            if self.worker_pool is not None:
+                result = self.worker_pool.call(function.__name__, call_kwargs, timeout=remaining_time())
+            else:
+                remaining_time()  # fail fast when the deadline has already passed
+                result = function(**call_kwargs)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            if isinstance(result, dict) and "error" in result:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return runtime counters (response cache, worker pool, transport, circuit breakers, rate limits)"""
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "workers": self.worker_pool.stats() if self.worker_pool is not None else None,
+            "transport": self._transport.stats() if self._transport is not None else None,
+            "circuit_breakers": self._upstream_stats(BREAKERS.stats()),
+            "rate_limits": self._upstream_stats(self._rate_limit_stats())
+        }
+
+    def _rate_limit_stats(self) -> Dict[str, Any]:
+        if self.rate_limit_config is None:
+            return {}
+        from .ratelimit import LIMITERS
+        return LIMITERS.stats()
+
+    def _upstream_stats(self, all_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the entries of process-wide registries that belong to this tool's upstreams"""
+        upstreams = set(self._transport.hosts) if self._transport is not None else set()
+        if self.upstream:
+            upstreams.add(self.upstream)
+        return {upstream: all_stats[upstream] for upstream in sorted(upstreams) if upstream in all_stats}
+
+
+class GeneratedTool:
+    """
+    Behaviour shared by every generated tool class.
+    Subclasses set name, description, parameters_schema, runtime and their compiled _validator,
+    and implement run().
+    """
+    name: str
+    description: str
+    parameters_schema: Dict[str, Any]
+    runtime: Optional[ToolRuntime] = None
+    _validator: Callable[[Any], List[Dict[str, str]]]
+
+    def run(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        raise NotImplementedError
+
+    def validate(self, params: Dict[str, Any]) -> bool:
+        """Validate input parameters"""
+        return not self._validator(params)
+
+    def validation_errors(self, params: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Return every schema violation in params as {"path", "message"} dicts"""
+        return self._validator(params)
+
+    def run_many(self, params_list: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run the tool over many parameter sets concurrently.
+        All inputs are validated up front; results are returned in input order.
+        """
+        from .batch import run_batch
+        return run_batch(self.run, self._validator, params_list, max_concurrency)
+
+    def runtime_stats(self) -> Dict[str, Any]:
+        """Return runtime counters for monitoring"""
+        return self.runtime.stats() if self.runtime is not None else {}
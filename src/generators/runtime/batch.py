@@ -0,0 +1,48 @@
+"""
+Batch execution of a tool over many parameter sets.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+
+def run_batch(execute: Callable[[Dict[str, Any]], Any],
+              collect_errors: Callable[[Any], List[Dict[str, str]]],
+              params_list: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+    """
+    Validate every parameter set up front, then execute the valid ones concurrently.
+
+    Args:
+        execute: Runs one parameter set (the tool's run method)
+        collect_errors: Returns the schema violations of one parameter set
+        params_list: Parameter sets to execute
+        max_concurrency: Maximum number of parameter sets executed at the same time
+
+    Returns:
+        One entry per parameter set, in input order: {"ok": True, "result": ...} or
+        {"ok": False, "error": ..., "errors": [...]} for invalid input or failed calls
+    """
+    params_list = list(params_list)
+    results: List[Dict[str, Any]] = [None] * len(params_list)
+    pending = []
+    for index, params in enumerate(params_list):
+        errors = collect_errors(params)
+        if errors:
+            results[index] = {"ok": False, "error": "Invalid parameters", "errors": errors}
+        else:
+            pending.append(index)
+
+    def execute_one(index: int) -> Dict[str, Any]:
+        try:
+            result = execute(params_list[index])
+        except Exception as e:
+            return {"ok": False, "error": str(e), "errors": []}
+        if isinstance(result, dict) and "error" in result:
+            return {"ok": False, "error": result.get("error"), "errors": [], "result": result}
+        return {"ok": True, "result": result}
+
+    if pending:
+        workers = max(1, min(int(max_concurrency), len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tool-batch") as executor:
+            for index, outcome in zip(pending, executor.map(execute_one, pending)):
+                results[index] = outcome
+    return results
@@ -0,0 +1,147 @@
+"""
+Per-tool response cache keyed by canonicalized call parameters.
+
+Supports TTL expiry, size-bounded LRU eviction, single-flight deduplication of
+concurrent identical calls and stale-while-revalidate background refreshes.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Generated tools report failures as {"error": ...} dicts; never cache those"""
+    return not (isinstance(result, dict) and "error" in result)
+
+
+class _InFlight:
+    """A call currently being executed on behalf of every caller with the same key"""
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU response cache with TTL, single-flight and stale-while-revalidate.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 256,
+                 stale_while_revalidate_seconds: float = 0.0,
+                 cacheable: Callable[[Any], bool] = _is_cacheable):
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries))
+        self.stale_while_revalidate_seconds = max(0.0, float(stale_while_revalidate_seconds))
+        self.cacheable = cacheable
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (value, stored_at)
+        self._inflight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stale_hits": 0, "coalesced": 0,
+                          "evictions": 0, "refreshes": 0, "refresh_errors": 0}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["ResponseCache"]:
+        """Build a cache from the metadata.json "cache" section; None when disabled"""
+        if not config or not config.get("enabled"):
+            return None
+        return cls(
+            ttl_seconds=config.get("ttl_seconds", 300),
+            max_entries=config.get("max_entries", 256),
+            stale_while_revalidate_seconds=config.get("stale_while_revalidate_seconds", 0),
+        )
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Canonicalize params so that equal arguments map to the same key regardless of order"""
+        return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+    def get_or_call(self, params: Dict[str, Any], fn: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for params, calling fn on a miss.
+        Concurrent misses for the same key share a single call to fn.
+        """
+        key = self.make_key(params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                age = now - stored_at
+                if age < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return value
+                if age < self.ttl_seconds + self.stale_while_revalidate_seconds:
+                    self._entries.move_to_end(key)
+                    self._counters["stale_hits"] += 1
+                    if key not in self._inflight:
+                        self._start_refresh(key, fn)
+                    return value
+                del self._entries[key]
+
+            call = self._inflight.get(key)
+            if call is not None:
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                self._counters["misses"] += 1
+                call = self._inflight[key] = _InFlight()
+                leader = True
+
+        if leader:
+            self._execute(key, fn, call)
+        else:
+            call.done.wait()
+
+        if call.exception is not None:
+            raise call.exception
+        return call.result
+
+    def _start_refresh(self, key: str, fn: Callable[[], Any]) -> None:
+        """Refresh a stale entry in the background (caller holds the lock)"""
+        call = self._inflight[key] = _InFlight()
+        self._counters["refreshes"] += 1
+        thread = threading.Thread(target=self._execute, args=(key, fn, call),
+                                  name="response-cache-refresh", daemon=True)
+        thread.start()
+
+    def _execute(self, key: str, fn: Callable[[], Any], call: _InFlight) -> None:
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.exception = e
+        with self._lock:
+            if call.exception is None and self.cacheable(call.result):
+                self._store(key, call.result)
+            elif call.exception is not None and key in self._entries:
+                self._counters["refresh_errors"] += 1
+            self._inflight.pop(key, None)
+        call.done.set()
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["size"] = len(self._entries)
+            stats["max_entries"] = self.max_entries
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_ratio"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,119 @@
+"""
+Disk-backed validator cache for conditional HTTP requests.
+
+For every GET that returned 200 with an ``ETag`` or ``Last-Modified`` header, the
+decoded body and validators are kept on disk. The next identical request is sent with
+``If-None-Match`` / ``If-Modified-Since``; when the upstream answers ``304 Not Modified``
+the stored body is served instead of downloading it again.
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+class ValidatorCache:
+    """Stores (validators, body) per request under directory; at most max_entries entries are kept"""
+
+    def __init__(self, directory: str, max_entries: int = 512, max_body_bytes: int = 32 * 1024 * 1024):
+        self.directory = directory
+        self.max_entries = max(1, int(max_entries))
+        self.max_body_bytes = int(max_body_bytes)
+        self._lock = threading.Lock()
+        self._counters = {"stored": 0, "revalidated": 0, "not_modified": 0, "bytes_saved": 0}
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]], headers: Optional[Mapping[str, str]]) -> str:
+        """Key on URL, parameters and request headers (credentials differ per key, so do responses)"""
+        material = json.dumps([url, sorted((params or {}).items()), sorted((headers or {}).items())],
+                              default=str, separators=(",", ":"))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        return os.path.join(self.directory, key + ".json"), os.path.join(self.directory, key + ".body")
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for a stored entry, empty when there is none"""
+        meta = self._read_meta(key)
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        if headers:
+            self._count("revalidated")
+        return headers
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Return (meta, body) for a 304 response, counting the bytes that were not downloaded"""
+        meta_path, body_path = self._paths(key)
+        meta = self._read_meta(key)
+        try:
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+        if not meta:
+            return None
+        try:
+            os.utime(meta_path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        with self._lock:
+            self._counters["not_modified"] += 1
+            self._counters["bytes_saved"] += len(body)
+        return meta, body
+
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> bool:
+        """Keep the body of a 200 response that carries validators; returns whether it was stored"""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified) or len(body) > self.max_body_bytes:
+            return False
+        meta = {"etag": etag, "last_modified": last_modified,
+                "content_type": headers.get("Content-Type"), "size": len(body)}
+        meta_path, body_path = self._paths(key)
+        os.makedirs(self.directory, exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        # Body first, then metadata: a reader never sees metadata pointing at a partial body
+        with open(body_path + suffix, "wb") as f:
+            f.write(body)
+        os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+        self._count("stored")
+        self._evict()
+        return True
+
+    def _read_meta(self, key: str) -> Dict[str, Any]:
+        try:
+            with open(self._paths(key)[0], "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _evict(self) -> None:
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_entries]:
+            for path in self._paths(entry.name[:-len(".json")]):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counters)
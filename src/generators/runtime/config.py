@@ -0,0 +1,29 @@
+"""
+Runtime configuration loading for generated tools.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+
+def load_tool_metadata(tool_file: str) -> Dict[str, Any]:
+    """
+    Read the metadata.json next to a generated tool module.
+    Returns an empty dict when the file is missing or unreadable.
+    """
+    metadata_path = Path(tool_file).resolve().with_name("metadata.json")
+    try:
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def load_runtime_config(tool_file: str) -> Dict[str, Any]:
+    """
+    Read the "runtime" section of the metadata.json next to a generated tool module.
+    Returns an empty dict when the file or section is missing or unreadable.
+    """
+    runtime_config = load_tool_metadata(tool_file).get("runtime")
+    return runtime_config if isinstance(runtime_config, dict) else {}
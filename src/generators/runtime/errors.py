@@ -0,0 +1,14 @@
+"""
+Error shaping shared by generated tools.
+"""
+from typing import Any, Dict
+
+
+def error_response(error: str, message: str, **details: Any) -> Dict[str, Any]:
+    """
+    Build the error dict generated tools return instead of raising.
+    Extra keyword arguments are included as additional fields.
+    """
+    response = {"error": error, "message": message}
+    response.update(details)
+    return response
@@ -0,0 +1,26 @@
+"""
+Loading generated tool modules by file path.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def load_tool_class(wrapper_file: str, class_name: str, module_stem: str = "tool"):
+    """
+    Import the <module_stem>.py next to wrapper_file under a module name unique to its directory
+    and return class_name from it. Repeated calls reuse the already imported module.
+    """
+    tool_file = Path(wrapper_file).resolve().with_name(f"{module_stem}.py")
+    module_name = f"{tool_file.parent.name}_{module_stem}"
+    module = sys.modules.get(module_name)
+    if module is None or Path(getattr(module, "__file__", "")).resolve() != tool_file:
+        spec = importlib.util.spec_from_file_location(module_name, tool_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+    return getattr(module, class_name)
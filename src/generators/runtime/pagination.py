@@ -0,0 +1,176 @@
+"""
+Automatic pagination for generated REST tools.
+
+The pagination spec comes from InputParser ("pagination" in the parsed API data) and is
+stored in the "pagination" section of the tool's runtime config. Supported styles:
+
+- ``page``: page number + page size parameters (random access)
+- ``offset``: offset + limit parameters (random access)
+- ``cursor``: the next cursor is read from each page body (sequential)
+- ``link_header``: the next page URL comes from the Link header or a body field (sequential)
+
+Random-access styles fetch pages concurrently in windows of ``max_concurrency``; items
+are always yielded in page order as one merged stream.
+"""
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PAGINATION_STYLES = ("page", "offset", "cursor", "link_header")
+
+# fetch(page_params, page_url) -> (page body, URL of the next page from the Link header or None)
+FetchPage = Callable[[Dict[str, Any], Optional[str]], Tuple[Any, Optional[str]]]
+
+
+def get_path(value: Any, path: Optional[str], default: Any = None) -> Any:
+    """Read a dotted path ("meta.next_cursor") from nested dicts"""
+    if not path:
+        return value
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+class Paginator:
+    """
+    Walks the pages of one request and yields their items.
+    After iteration, pages_fetched and complete describe what was read.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.style = spec.get("style")
+        if self.style not in PAGINATION_STYLES:
+            raise ValueError(f"Unsupported pagination style: {self.style}")
+        self.items_field = spec.get("items_field")
+        self.page_param = spec.get("page_param") or "page"
+        self.offset_param = spec.get("offset_param") or "offset"
+        self.size_param = spec.get("size_param") or ("limit" if self.style == "offset" else None)
+        self.page_size = int(spec.get("page_size") or 0) or None
+        self.start_page = int(spec.get("start_page", 1))
+        self.cursor_param = spec.get("cursor_param") or "cursor"
+        self.next_cursor_field = spec.get("next_cursor_field")
+        self.next_url_field = spec.get("next_url_field")
+        self.total_field = spec.get("total_field")
+        self.total_pages_field = spec.get("total_pages_field")
+        self.max_pages = max(1, int(spec.get("max_pages", 10)))
+        self.max_items = spec.get("max_items")
+        self.max_concurrency = max(1, int(spec.get("max_concurrency", 4)))
+        self.pages_fetched = 0
+        self.complete = False
+        self.first_page: Any = None
+
+    def page_items(self, body: Any) -> List[Any]:
+        items = get_path(body, self.items_field, []) if self.items_field else body
+        return items if isinstance(items, list) else []
+
+    def iter_items(self, fetch: FetchPage) -> Iterator[Any]:
+        """Yield items from every page, in order, until the last page, max_pages or max_items"""
+        yielded = 0
+        for items in self._iter_pages(fetch):
+            for item in items:
+                if self.max_items is not None and yielded >= self.max_items:
+                    self.complete = False
+                    return
+                yielded += 1
+                yield item
+
+    def collect(self, fetch: FetchPage) -> Any:
+        """
+        Fetch every page and return the first page body with its items replaced by the merged items
+        (or the merged list when the pages are bare arrays)
+        """
+        items = list(self.iter_items(fetch))
+        if not self.items_field or not isinstance(self.first_page, dict):
+            return items
+        merged = copy.copy(self.first_page)
+        parts = self.items_field.split(".")
+        node = merged
+        for part in parts[:-1]:  # copy the dicts along the path so the page body is left untouched
+            node[part] = dict(node.get(part) or {})
+            node = node[part]
+        node[parts[-1]] = items
+        return merged
+
+    def _iter_pages(self, fetch: FetchPage) -> Iterator[List[Any]]:
+        first_params = self._page_params(0) if self.style in ("page", "offset") else {}
+        body, next_url = fetch(first_params, None)
+        self.first_page = body
+        self.pages_fetched = 1
+        items = self.page_items(body)
+        yield items
+        if self.style in ("page", "offset"):
+            yield from self._iter_random_access(fetch, body, items)
+        else:
+            yield from self._iter_sequential(fetch, body, next_url)
+
+    def _page_params(self, index: int) -> Dict[str, Any]:
+        if self.style == "page":
+            params = {self.page_param: self.start_page + index}
+        else:
+            params = {self.offset_param: index * (self.page_size or 0)}
+        if self.size_param and self.page_size:
+            params[self.size_param] = self.page_size
+        return params
+
+    def _iter_random_access(self, fetch: FetchPage, first_body: Any, first_items: List[Any]) -> Iterator[List[Any]]:
+        if self.style == "offset" and not self.page_size:
+            # Offsets need a page size; take it from the first page
+            self.page_size = len(first_items)
+        page_size = self.page_size or len(first_items)
+        total_pages = self._total_pages(first_body, page_size)
+        last_page = min(self.max_pages, total_pages) if total_pages is not None else self.max_pages
+        if not first_items or (total_pages is None and page_size and len(first_items) < page_size):
+            self.complete = True
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="pagination")
+        try:
+            index = 1
+            while index < last_page:
+                window = range(index, min(index + self.max_concurrency, last_page))
+                futures = [executor.submit(fetch, self._page_params(i), None) for i in window]
+                for future in futures:
+                    body, _ = future.result()
+                    self.pages_fetched += 1
+                    items = self.page_items(body)
+                    yield items
+                    if not items or (total_pages is None and len(items) < page_size):
+                        self.complete = True
+                        return
+                index += len(window)
+            self.complete = total_pages is not None and last_page >= total_pages
+        finally:
+            executor.shutdown(wait=False)
+
+    def _total_pages(self, body: Any, page_size: int) -> Optional[int]:
+        total_pages = get_path(body, self.total_pages_field, None) if self.total_pages_field else None
+        if isinstance(total_pages, int):
+            return total_pages
+        total = get_path(body, self.total_field, None) if self.total_field else None
+        if isinstance(total, int) and page_size:
+            return -(-total // page_size)
+        return None
+
+    def _iter_sequential(self, fetch: FetchPage, body: Any, next_url: Optional[str]) -> Iterator[List[Any]]:
+        while self.pages_fetched < self.max_pages:
+            if self.style == "cursor":
+                cursor = get_path(body, self.next_cursor_field, None) if self.next_cursor_field else None
+                if cursor in (None, "", False):
+                    self.complete = True
+                    return
+                body, next_url = fetch({self.cursor_param: cursor}, None)
+            else:
+                url = get_path(body, self.next_url_field, None) if self.next_url_field else None
+                url = url or next_url
+                if not url:
+                    self.complete = True
+                    return
+                body, next_url = fetch({}, url)
+            self.pages_fetched += 1
+            items = self.page_items(body)
+            yield items
+            if not items:
+                self.complete = True
+                return
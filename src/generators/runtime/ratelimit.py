@@ -0,0 +1,208 @@
+"""
+Client-side rate limiting for generated tools.
+
+Each upstream (REST host, or package for python_package tools) gets a token bucket that
+every thread of the process shares. With ``shared: "process"`` the bucket state lives in a
+small file guarded by an ``fcntl`` lock, so every process on the host that calls the same
+upstream draws from the same budget.
+
+Upstream feedback is honoured: ``Retry-After`` on a 429/503, and an exhausted
+``X-RateLimit-Remaining`` with ``X-RateLimit-Reset``, pause the bucket until the vendor
+says requests may resume.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows: buckets stay per process
+    fcntl = None
+
+# Reset values above this are epoch timestamps rather than second deltas
+_EPOCH_THRESHOLD = 10 ** 9
+
+_STATE = struct.Struct(">ddd")  # tokens, updated_at, blocked_until (wall clock)
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a call would have to wait for the rate limit longer than it is allowed to"""
+
+
+def retry_after_seconds(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds the upstream asks us to wait, from Retry-After (seconds or HTTP date) or from an
+    exhausted X-RateLimit-Remaining with X-RateLimit-Reset (epoch or seconds). None when not limited.
+    """
+    now = time.time() if now is None else now
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        retry_after = retry_after.strip()
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - now)
+            except (TypeError, ValueError):
+                pass
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            if float(remaining) > 0:
+                return None
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        return max(0.0, reset_value - now) if reset_value > _EPOCH_THRESHOLD else reset_value
+    return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: rate tokens per second, at most burst stored.
+    Calls reserve a token and sleep until it is theirs, so waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        self.capacity = max(1.0, float(burst if burst else self.rate))
+        self._lock = threading.Lock()
+        self._memory_state: List[float] = [self.capacity, time.time(), 0.0]
+        self._counters = {"acquired": 0, "waited": 0, "rejected": 0, "pauses": 0}
+        self._waited_seconds = 0.0
+
+    @contextmanager
+    def _state(self) -> Iterator[List[float]]:
+        """Locked, mutable [tokens, updated_at, blocked_until]"""
+        with self._lock:
+            yield self._memory_state
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Take one token, sleeping until it is available. Raises RateLimitExceeded (without using the
+        token) when that would take longer than timeout. Returns the time waited.
+        """
+        now = time.time()
+        with self._state() as state:
+            tokens, updated_at, blocked_until = state
+            tokens = min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate)
+            tokens -= 1.0
+            wait = max(-tokens / self.rate if tokens < 0 else 0.0, blocked_until - now)
+            if timeout is not None and wait > timeout:
+                state[0], state[1] = tokens + 1.0, now
+                rejected = True
+            else:
+                state[0], state[1] = tokens, now
+                rejected = False
+        with self._lock:
+            if rejected:
+                self._counters["rejected"] += 1
+            else:
+                self._counters["acquired"] += 1
+                if wait > 0:
+                    self._counters["waited"] += 1
+                    self._waited_seconds += wait
+        if rejected:
+            raise RateLimitExceeded(f"rate limited for another {wait:.1f}s")
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for seconds (upstream Retry-After) and drop stored burst"""
+        now = time.time()
+        with self._state() as state:
+            state[0] = min(state[0], 0.0)
+            state[1] = now
+            state[2] = max(state[2], now + seconds)
+        with self._lock:
+            self._counters["pauses"] += 1
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Pause the bucket when a response says the upstream is limiting us; returns the pause"""
+        if status_code not in (429, 503) and "X-RateLimit-Remaining" not in headers:
+            return None
+        wait = retry_after_seconds(headers)
+        if wait is None and status_code == 429:
+            wait = 1.0 / self.rate
+        if wait:
+            self.pause(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["waited_seconds"] = round(self._waited_seconds, 3)
+        stats["rate"] = self.rate
+        stats["burst"] = self.capacity
+        return stats
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared by every process on the host through a locked file"""
+
+    def __init__(self, rate: float, burst: Optional[float], path: str):
+        super().__init__(rate, burst)
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @contextmanager
+    def _state(self) -> Iterator[List[float]]:
+        with self._lock, open(self.path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read(_STATE.size)
+                state = list(_STATE.unpack(raw)) if len(raw) == _STATE.size else [self.capacity, time.time(), 0.0]
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(_STATE.pack(*state))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class LimiterRegistry:
+    """Process-wide token buckets keyed by upstream"""
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, upstream: str, config: Dict[str, Any]) -> TokenBucket:
+        """Return the bucket for upstream, creating it from config (first caller wins)"""
+        bucket = self._buckets.get(upstream)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(upstream)
+                if bucket is None:
+                    bucket = self._buckets[upstream] = self._create(upstream, config)
+        return bucket
+
+    @staticmethod
+    def _create(upstream: str, config: Dict[str, Any]) -> TokenBucket:
+        rate = float(config.get("requests_per_second", 10))
+        burst = config.get("burst")
+        if config.get("shared") == "process" and fcntl is not None:
+            state_dir = config.get("state_dir") or os.path.join(tempfile.gettempdir(), "mcp_tool_ratelimit")
+            name = hashlib.sha1(upstream.encode("utf-8")).hexdigest()[:16]
+            return FileTokenBucket(rate, burst, os.path.join(state_dir, f"{name}.bucket"))
+        return TokenBucket(rate, burst)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {upstream: bucket.stats() for upstream, bucket in buckets.items()}
+
+
+LIMITERS = LimiterRegistry()
@@ -0,0 +1,168 @@
+"""
+Per-call deadlines and per-upstream circuit breakers for generated tools.
+
+A deadline is opened around each tool call (ToolRuntime.invoke) and is visible to the
+code running that call on the same thread, so the HTTP transport and the worker pool can
+bound their own waits by the time that is left.
+
+Circuit breakers are shared by every tool in the process that talks to the same upstream
+(REST host, or package function for python_package tools). After ``failure_threshold``
+consecutive failures a breaker opens and calls fail fast; once ``recovery_timeout_seconds``
+have passed it lets a limited number of probe calls through (half-open) and closes again
+when they succeed.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call's deadline has passed"""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+
+class Deadline:
+    """Absolute point in time by which a call must complete"""
+    __slots__ = ("expires_at",)
+
+    def __init__(self, timeout_seconds: float):
+        self.expires_at = time.monotonic() + float(timeout_seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+
+_local = threading.local()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the tool call running on this thread, if any"""
+    return getattr(_local, "deadline", None)
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """Seconds left before the current deadline, capped by default; default when no deadline is set"""
+    deadline = current_deadline()
+    if deadline is None:
+        return default
+    deadline.check()
+    remaining = deadline.remaining()
+    return remaining if default is None else min(default, remaining)
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Run the block under a deadline; an enclosing, earlier deadline is kept"""
+    previous = current_deadline()
+    if timeout_seconds is None:
+        yield previous
+        return
+    deadline = Deadline(timeout_seconds)
+    if previous is not None and previous.expires_at < deadline.expires_at:
+        deadline = previous
+    _local.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _local.deadline = previous
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout_seconds: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout_seconds = float(recovery_timeout_seconds)
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._counters = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError when the call must not reach the upstream"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout_seconds:
+                    self._counters["rejected"] += 1
+                    raise CircuitOpenError("circuit breaker is open")
+                self.state = self.HALF_OPEN
+                self._probes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self._counters["rejected"] += 1
+                    raise CircuitOpenError("circuit breaker is half-open and a probe is in flight")
+                self._probes += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._counters["successes"] += 1
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._counters["failures"] += 1
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self._counters["opened"] += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["state"] = self.state
+            stats["consecutive_failures"] = self._failures
+        return stats
+
+
+class BreakerRegistry:
+    """Process-wide circuit breakers keyed by upstream"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, upstream: str, config: Optional[Dict[str, Any]] = None) -> CircuitBreaker:
+        """Return the breaker for upstream, creating it from config (first caller wins)"""
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            config = config or {}
+            with self._lock:
+                breaker = self._breakers.get(upstream)
+                if breaker is None:
+                    breaker = self._breakers[upstream] = CircuitBreaker(
+                        failure_threshold=config.get("failure_threshold", 5),
+                        recovery_timeout_seconds=config.get("recovery_timeout_seconds", 30),
+                        half_open_max_calls=config.get("half_open_max_calls", 1),
+                    )
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {upstream: breaker.stats() for upstream, breaker in breakers.items()}
+
+
+BREAKERS = BreakerRegistry()
@@ -0,0 +1,161 @@
+"""
+Incremental JSON parsing with field projection for large upstream responses.
+
+A projection is a tree of the fields to keep: ``None`` keeps a value whole, a dict
+``{key: projection}`` keeps only those keys of an object. Arrays are transparent, so
+the projection of an array applies to each of its items. Projections are built from a
+tool's output schema or from dotted field paths ("flights.price").
+
+When ``ijson`` is installed the response body is parsed event by event and values
+outside the projection (or past ``max_items`` in an array) are skipped without ever
+being materialised. Without it the body is parsed with ``json`` and projected afterwards.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # optional: fall back to full parse + projection
+    ijson = None
+
+Projection = Optional[Dict[str, Any]]
+
+_SKIP = object()
+
+
+def projection_from_schema(schema: Any) -> Projection:
+    """Build a projection from a JSON-schema-like output schema (properties / items)"""
+    if not isinstance(schema, dict):
+        return None
+    properties = schema.get("properties")
+    if isinstance(properties, dict) and properties:
+        return {name: projection_from_schema(field) for name, field in properties.items()}
+    if isinstance(schema.get("items"), dict):
+        return projection_from_schema(schema["items"])
+    return None
+
+
+def projection_from_paths(paths: Iterable[str]) -> Projection:
+    """Build a projection from dotted paths; "[]" markers are ignored since arrays are transparent"""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        parts = [part for part in str(path).replace("[]", "").split(".") if part]
+        if not parts:
+            return None
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:  # a shorter path already keeps this subtree whole
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    return tree or None
+
+
+def project(value: Any, projection: Projection = None, max_items: Optional[int] = None) -> Any:
+    """Apply a projection and array cap to an already parsed value"""
+    if isinstance(value, list):
+        items = value if max_items is None else value[:max_items]
+        if projection is None and max_items is None:
+            return value
+        return [project(item, projection, max_items) for item in items]
+    if isinstance(value, dict):
+        if projection is None:
+            if max_items is None:
+                return value
+            return {key: project(item, None, max_items) for key, item in value.items()}
+        return {key: project(item, projection[key], max_items)
+                for key, item in value.items() if key in projection}
+    return value
+
+
+class _Frame:
+    __slots__ = ("container", "projection", "is_list", "key")
+
+    def __init__(self, container: Any, projection: Projection, is_list: bool):
+        self.container = container
+        self.projection = projection
+        self.is_list = is_list
+        self.key: Any = None
+
+
+def build_projected(events: Iterable[Tuple[str, Any]], projection: Projection = None,
+                    max_items: Optional[int] = None) -> Any:
+    """
+    Build the projected value from (event, value) pairs as produced by ijson.basic_parse.
+    Skipped subtrees are consumed without being built, so memory is bounded by what is kept.
+    """
+    stack: List[_Frame] = []
+    root: Any = None
+    skip_depth = 0
+    for event, value in events:
+        if skip_depth:
+            if event in ("start_map", "start_array"):
+                skip_depth += 1
+            elif event in ("end_map", "end_array"):
+                skip_depth -= 1
+            continue
+
+        if event == "map_key":
+            frame = stack[-1]
+            frame.key = value if frame.projection is None or value in frame.projection else _SKIP
+            continue
+        if event in ("end_map", "end_array"):
+            stack.pop()
+            continue
+
+        # A value starts: decide whether it is kept and which projection applies below it
+        child_projection = projection
+        if stack:
+            parent = stack[-1]
+            if parent.is_list:
+                keep = max_items is None or len(parent.container) < max_items
+                child_projection = parent.projection
+            else:
+                keep = parent.key is not _SKIP
+                if keep and parent.projection is not None:
+                    child_projection = parent.projection[parent.key]
+                elif keep:
+                    child_projection = None
+            if not keep:
+                if event in ("start_map", "start_array"):
+                    skip_depth = 1
+                continue
+
+        if event == "start_map":
+            item: Any = {}
+            frame = _Frame(item, child_projection, False)
+        elif event == "start_array":
+            item = []
+            frame = _Frame(item, child_projection, True)
+        else:
+            item, frame = value, None
+
+        if stack:
+            parent = stack[-1]
+            if parent.is_list:
+                parent.container.append(item)
+            else:
+                parent.container[parent.key] = item
+        else:
+            root = item
+        if frame is not None:
+            stack.append(frame)
+    return root
+
+
+def read_json(response: Any, projection: Projection = None, max_items: Optional[int] = None,
+              stream: bool = False) -> Any:
+    """
+    Decode a requests response, keeping only the projected fields and at most max_items per array.
+    With stream=True (request sent with stream=True) and ijson installed, the body is parsed
+    incrementally from the socket.
+    """
+    # Responses served from the validator cache have their body in memory and no raw stream
+    if stream and ijson is not None and getattr(response, "raw", None) is not None:
+        try:
+            response.raw.decode_content = True
+            return build_projected(ijson.basic_parse(response.raw, use_float=True), projection, max_items)
+        finally:
+            response.close()
+    return project(response.json(), projection, max_items)
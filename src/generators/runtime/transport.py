@@ -0,0 +1,184 @@
+"""
+Pooled HTTP transport for generated REST tools.
+"""
+import os
+import threading
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlsplit
+
+from .ratelimit import LIMITERS
+from .resilience import BREAKERS, remaining_time
+
+
+def accept_encoding() -> str:
+    """Content codings requests can decode here: br only when a brotli module is installed"""
+    for module_name in ("brotli", "brotlicffi"):
+        try:
+            __import__(module_name)
+            return "gzip, deflate, br"
+        except ImportError:
+            continue
+    return "gzip, deflate"
+
+
+class HttpTransport:
+    """
+    One requests.Session per tool, shared by every call (including concurrent run_many calls).
+    requests is imported on first use so python_package tools never pay for it.
+
+    Every request is bounded by the current call deadline (or timeout_seconds), goes through
+    the circuit breaker of its host when breaker_config is given, and waits for the host's
+    token bucket when rate_limit_config is given. Responses are negotiated compressed, and
+    with a "conditional_cache" section GETs are revalidated against a disk validator cache
+    kept under cache_dir.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, timeout_seconds: Optional[float] = None,
+                 breaker_config: Optional[Dict[str, Any]] = None,
+                 rate_limit_config: Optional[Dict[str, Any]] = None, cache_dir: Optional[str] = None):
+        config = config or {}
+        self.pool_connections = int(config.get("pool_connections", 4))
+        self.pool_maxsize = int(config.get("pool_maxsize", 32))
+        self.timeout_seconds = timeout_seconds
+        self.breaker_config = breaker_config
+        self.rate_limit_config = rate_limit_config
+        self.max_retries = int((rate_limit_config or {}).get("retry_on_429", 1))
+        self.hosts: Set[str] = set()
+        self.compression = config.get("compression", True)
+        self.validator_cache = None
+        conditional_config = config.get("conditional_cache")
+        if conditional_config and conditional_config.get("enabled"):
+            from .conditional import ValidatorCache
+            self.validator_cache = ValidatorCache(
+                conditional_config.get("directory") or cache_dir or os.path.join(os.getcwd(), ".http_cache"),
+                max_entries=conditional_config.get("max_entries", 512),
+                max_body_bytes=conditional_config.get("max_body_bytes", 32 * 1024 * 1024),
+            )
+        self._counters = {"requests": 0, "compressed_responses": 0, "compression_bytes_saved": 0}
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    session.headers["Accept-Encoding"] = accept_encoding() if self.compression else "identity"
+                    for prefix in ("https://", "http://"):
+                        session.mount(prefix, HTTPAdapter(pool_connections=self.pool_connections,
+                                                          pool_maxsize=self.pool_maxsize))
+                    self._session = session
+        return self._session
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, **kwargs: Any):
+        """Send a GET request over the pooled session and return the response"""
+        return self.request("GET", url, params=params, headers=headers, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any):
+        """
+        Send a request over the pooled session.
+        With rate limiting, a 429 pauses the host's bucket for its Retry-After and the request is
+        retried (up to retry_on_429 times) when the wait fits in the call deadline.
+        """
+        host = urlsplit(url).netloc
+        self.hosts.add(host)
+        limiter = LIMITERS.get(host, self.rate_limit_config) if self.rate_limit_config is not None else None
+        timeout = kwargs.pop("timeout", None)
+        if timeout is None:
+            timeout = self.timeout_seconds
+
+        cache_key = None
+        if self.validator_cache is not None and method == "GET" and not kwargs.get("stream"):
+            cache_key = self.validator_cache.make_key(url, kwargs.get("params"), kwargs.get("headers"))
+            conditional_headers = self.validator_cache.conditional_headers(cache_key)
+            if conditional_headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
+
+        attempts = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(timeout=remaining_time())
+            response = self._send(host, method, url, timeout=remaining_time(timeout), **kwargs)
+            response = self._after_response(response, cache_key, streamed=bool(kwargs.get("stream")))
+            if limiter is None:
+                return response
+            wait = limiter.observe(response.status_code, response.headers)
+            if response.status_code != 429 or attempts >= self.max_retries or wait is None:
+                return response
+            remaining = remaining_time()
+            if remaining is not None and wait > remaining:
+                return response
+            attempts += 1
+            response.close()
+
+    def _after_response(self, response, cache_key: Optional[str], streamed: bool):
+        """Record compression savings, serve 304s from the validator cache and store new validators"""
+        with self._lock:
+            self._counters["requests"] += 1
+        if not streamed and response.headers.get("Content-Encoding") and response.headers.get("Content-Length"):
+            try:
+                saved = len(response.content) - int(response.headers["Content-Length"])
+            except ValueError:
+                saved = 0
+            with self._lock:
+                self._counters["compressed_responses"] += 1
+                self._counters["compression_bytes_saved"] += max(0, saved)
+        if cache_key is None:
+            return response
+        if response.status_code == 304:
+            cached = self.validator_cache.load(cache_key)
+            if cached is not None:
+                return self._cached_response(response, *cached)
+        elif response.status_code == 200:
+            self.validator_cache.store(cache_key, response.headers, response.content)
+        return response
+
+    @staticmethod
+    def _cached_response(not_modified, meta: Dict[str, Any], body: bytes):
+        """Turn a 304 into a 200 response carrying the stored body"""
+        from requests.models import Response
+
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = body
+        response.headers.update(not_modified.headers)
+        response.headers.pop("Content-Encoding", None)
+        response.headers["Content-Length"] = str(len(body))
+        if meta.get("content_type"):
+            response.headers["Content-Type"] = meta["content_type"]
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.from_validator_cache = True
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request, compression and validator cache counters"""
+        with self._lock:
+            stats = dict(self._counters)
+        stats["validator_cache"] = self.validator_cache.stats() if self.validator_cache is not None else None
+        return stats
+
+    def _send(self, host: str, method: str, url: str, **kwargs: Any):
+        """Send one request; connection errors, timeouts and 5xx responses count against the host's breaker"""
+        breaker = None
+        if self.breaker_config is not None:
+            breaker = BREAKERS.get(host, self.breaker_config)
+            breaker.before_call()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return response
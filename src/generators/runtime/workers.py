@@ -0,0 +1,299 @@
+"""
+Warm worker pool for python_package tools.
+
+Each worker is a separate interpreter that imports the tool module (and any heavy
+packages listed in "preload") once, then serves calls over length-prefixed pickle
+frames on its stdin/stdout. Workers are recycled after a number of calls or when
+their resident memory grows too much, and a call that exceeds its timeout kills
+the worker that is running it.
+"""
+import atexit
+import os
+import pickle
+import queue
+import select
+import struct
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Set in worker processes so the tool module they import never starts a nested pool
+WORKER_ENV_VAR = "MCP_TOOL_WORKER"
+
+_FRAME_HEADER = struct.Struct(">I")
+
+_WORKER_BOOTSTRAP = r'''
+import importlib
+import importlib.util
+import os
+import pickle
+import resource
+import struct
+import sys
+
+header = struct.Struct(">I")
+channel_in = sys.stdin.buffer
+channel_out = os.fdopen(os.dup(1), "wb")
+os.dup2(2, 1)  # anything the tool prints goes to stderr, not the reply channel
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def send(message):
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    channel_out.write(header.pack(len(payload)) + payload)
+    channel_out.flush()
+
+
+def read_exact(size):
+    data = b""
+    while len(data) < size:
+        chunk = channel_in.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+tool_file, preload = sys.argv[1], sys.argv[2:]
+try:
+    for module_name in preload:
+        importlib.import_module(module_name)
+    spec = importlib.util.spec_from_file_location("_pooled_tool", tool_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+except BaseException as e:
+    send(("error", "worker startup failed: %s: %s" % (type(e).__name__, e), rss_kb()))
+    sys.exit(1)
+send(("ready", None, rss_kb()))
+
+while True:
+    raw_header = read_exact(header.size)
+    if raw_header is None:
+        break
+    function_name, kwargs = pickle.loads(read_exact(header.unpack(raw_header)[0]))
+    try:
+        reply = ("ok", getattr(module, function_name)(**kwargs), rss_kb())
+        send(reply)
+    except BaseException as e:
+        send(("error", "%s: %s" % (type(e).__name__, e), rss_kb()))
+'''
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a worker process exits while serving a call"""
+
+
+class _Worker:
+    """One pre-imported interpreter serving calls for a tool module"""
+
+    def __init__(self, tool_file: str, preload: List[str], python_path: List[str]):
+        env = dict(os.environ)
+        env[WORKER_ENV_VAR] = "1"
+        if python_path:
+            env["PYTHONPATH"] = os.pathsep.join(python_path + [p for p in [env.get("PYTHONPATH")] if p])
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", _WORKER_BOOTSTRAP, tool_file, *preload],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+        )
+        self.calls = 0
+        self.ready = False
+        self.baseline_rss_kb = 0
+        self.rss_kb = 0
+
+    def wait_ready(self, timeout: float) -> None:
+        status, message, rss_kb = self._read_reply(time.monotonic() + timeout)
+        if status != "ready":
+            raise WorkerCrashedError(message)
+        self.ready = True
+        self.baseline_rss_kb = self.rss_kb = rss_kb
+
+    def call(self, function_name: str, kwargs: Dict[str, Any], timeout: float) -> Any:
+        payload = pickle.dumps((function_name, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.process.stdin.write(_FRAME_HEADER.pack(len(payload)) + payload)
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise WorkerCrashedError(f"worker exited before the call was sent: {e}")
+        status, result, rss_kb = self._read_reply(time.monotonic() + timeout)
+        self.calls += 1
+        self.rss_kb = rss_kb
+        if status != "ok":
+            raise RuntimeError(result)
+        return result
+
+    def _read_reply(self, deadline: float):
+        size = _FRAME_HEADER.unpack(self._read_exact(_FRAME_HEADER.size, deadline))[0]
+        return pickle.loads(self._read_exact(size, deadline))
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        chunks = []
+        while size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("worker call timed out")
+            chunk = os.read(fd, size)
+            if not chunk:
+                raise WorkerCrashedError(f"worker exited with code {self.process.poll()}")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def stop(self, kill: bool = False) -> None:
+        """Ask the worker to exit (EOF on stdin), or kill it; reaping happens in the background"""
+        try:
+            if kill:
+                self.process.kill()
+            else:
+                self.process.stdin.close()
+        except OSError:
+            pass
+        threading.Thread(target=self._reap, daemon=True).start()
+
+    def _reap(self) -> None:
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class WorkerPool:
+    """
+    Pool of warm worker processes executing a tool module's call function.
+    Thread-safe: each call checks out one idle worker, so up to pool_size calls run in parallel.
+    """
+
+    def __init__(self, tool_file: str, pool_size: int = 2, max_calls_per_worker: int = 100,
+                 max_memory_growth_mb: float = 256, timeout_seconds: float = 60,
+                 startup_timeout_seconds: float = 60, preload: Optional[List[str]] = None,
+                 python_path: Optional[List[str]] = None):
+        self.tool_file = str(tool_file)
+        self.pool_size = max(1, int(pool_size))
+        self.max_calls_per_worker = max(1, int(max_calls_per_worker))
+        self.max_memory_growth_kb = float(max_memory_growth_mb) * 1024
+        self.timeout_seconds = float(timeout_seconds)
+        self.startup_timeout_seconds = float(startup_timeout_seconds)
+        self.preload = list(preload or [])
+        self.python_path = list(python_path or [])
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self._counters = {"calls": 0, "errors": 0, "timeouts": 0, "crashes": 0,
+                          "recycled": 0, "spawned": 0}
+
+    @classmethod
+    def from_config(cls, tool_file: str, config: Optional[Dict[str, Any]],
+                    python_path: Optional[List[str]] = None) -> Optional["WorkerPool"]:
+        """Build a pool from the metadata.json "workers" section; None when disabled or inside a worker"""
+        if not config or not config.get("enabled") or os.environ.get(WORKER_ENV_VAR):
+            return None
+        pool = cls(
+            tool_file,
+            pool_size=config.get("pool_size", 2),
+            max_calls_per_worker=config.get("max_calls_per_worker", 100),
+            max_memory_growth_mb=config.get("max_memory_growth_mb", 256),
+            timeout_seconds=config.get("timeout_seconds", 60),
+            startup_timeout_seconds=config.get("startup_timeout_seconds", 60),
+            preload=config.get("preload", []),
+            python_path=python_path,
+        )
+        if config.get("prestart"):
+            pool.start()
+        return pool
+
+    def start(self) -> None:
+        """Spawn the workers; they import the tool in parallel while the caller carries on"""
+        with self._lock:
+            if self._started or self._closed:
+                return
+            self._started = True
+        for _ in range(self.pool_size):
+            self._idle.put(self._spawn())
+        atexit.register(self.shutdown)
+
+    def _spawn(self) -> _Worker:
+        self._count("spawned")
+        return _Worker(self.tool_file, self.preload, self.python_path)
+
+    def call(self, function_name: str, kwargs: Dict[str, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Execute module.function_name(**kwargs) in a worker.
+        Raises TimeoutError when the call exceeds its timeout and WorkerCrashedError when the worker dies.
+        """
+        if self._closed:
+            raise RuntimeError("worker pool has been shut down")
+        self.start()
+        timeout = self.timeout_seconds if timeout is None else timeout
+        worker = self._idle.get()
+        replace = False
+        try:
+            if not worker.ready:
+                worker.wait_ready(self.startup_timeout_seconds)
+            result = worker.call(function_name, kwargs, timeout)
+            with self._lock:
+                self._counters["calls"] += 1
+            replace = self._should_recycle(worker)
+            return result
+        except TimeoutError:
+            self._count("timeouts")
+            replace = True
+            raise
+        except WorkerCrashedError:
+            self._count("crashes")
+            replace = True
+            raise
+        except RuntimeError:
+            self._count("errors")
+            raise
+        finally:
+            if replace:
+                worker.stop(kill=True)
+                worker = self._spawn()
+            if self._closed:
+                worker.stop()
+            else:
+                self._idle.put(worker)
+
+    def _should_recycle(self, worker: _Worker) -> bool:
+        if worker.calls >= self.max_calls_per_worker \
+                or worker.rss_kb - worker.baseline_rss_kb > self.max_memory_growth_kb:
+            self._count("recycled")
+            return True
+        return False
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def shutdown(self) -> None:
+        """Stop every idle worker; busy workers are stopped when their call returns"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call/timeout/recycle counters for monitoring"""
+        with self._lock:
+            stats = dict(self._counters)
+        stats["pool_size"] = self.pool_size
+        stats["idle"] = self._idle.qsize()
+        return stats
@@ -0,0 +1,286 @@
+"""
+Validator Compiler - turns a tool's parameters schema into specialised validation code.
+
+The generated function is plain Python (no schema walking at call time): enums become
+frozensets, patterns are precompiled, and every declared type and nested class_structure
+field is checked. It returns a list of ``{"path": ..., "message": ...}`` errors, empty when
+the parameters are valid.
+"""
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Leading type word used in class_structure descriptions ("integer - Number of adults")
+_TYPE_ALIASES = {
+    'string': 'string', 'str': 'string',
+    'integer': 'integer', 'int': 'integer',
+    'number': 'number', 'float': 'number',
+    'boolean': 'boolean', 'bool': 'boolean',
+    'array': 'array', 'list': 'array',
+    'object': 'object', 'dict': 'object',
+}
+
+# isinstance checks emitted per JSON type; bool is excluded from integer/number explicitly
+_TYPE_CHECKS = {
+    'string': "not isinstance({v}, str)",
+    'integer': "type({v}) is bool or not isinstance({v}, int)",
+    'number': "type({v}) is bool or not isinstance({v}, (int, float))",
+    'boolean': "not isinstance({v}, bool)",
+    'array': "not isinstance({v}, list)",
+    'object': "not isinstance({v}, dict)",
+}
+
+_HASHABLE_SCALARS = "(str, int, float, bool)"
+
+
+class ValidatorCompiler:
+    """
+    Compiles a parameters schema into a validator function.
+    The same source is embedded into generated tools and exec'd by the MCP server.
+    """
+
+    def __init__(self, func_name: str = "_validate_params"):
+        self.func_name = func_name
+
+    def generate_source(self, parameters_schema: Dict[str, Any]) -> str:
+        """
+        Generate module-level source code for the validator function
+
+        Args:
+            parameters_schema: Mapping of parameter name to its schema
+
+        Returns:
+            Python source defining the constants and the validator function
+        """
+        self._constants: List[str] = []
+        self._counter = 0
+        self._uses_re = False
+
+        body: List[str] = []
+        for param_name, param_info in (parameters_schema or {}).items():
+            param_info = param_info if isinstance(param_info, dict) else {}
+            var = self._new_var('v')
+            body.append(f"    {var} = params.get({param_name!r})")
+            self._emit_field(body, var, param_info, [param_name],
+                             param_info.get('required', True), 1)
+
+        lines: List[str] = []
+        if self._uses_re:
+            lines.append("import re")
+            lines.append("")
+        lines.extend(self._constants)
+        if self._constants:
+            lines.append("")
+        lines.append("")
+        lines.append(f"def {self.func_name}(params):")
+        lines.append('    """Return a list of schema violations for params (empty when valid)"""')
+        lines.append("    if not isinstance(params, dict):")
+        lines.append("        return [{\"path\": \"\", \"message\": \"expected object, got \" + type(params).__name__}]")
+        lines.append("    errors = []")
+        lines.extend(body)
+        lines.append("    return errors")
+        return "\n".join(lines) + "\n"
+
+    def compile(self, parameters_schema: Dict[str, Any]) -> Callable[[Any], List[Dict[str, str]]]:
+        """Compile the schema and return the validator function"""
+        source = self.generate_source(parameters_schema)
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<validator:{self.func_name}>", "exec"), namespace)
+        return namespace[self.func_name]
+
+    def _new_var(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _add_constant(self, prefix: str, expression: str) -> str:
+        name = f"_{prefix}_{len(self._constants)}"
+        self._constants.append(f"{name} = {expression}")
+        return name
+
+    @staticmethod
+    def _path_expr(path: List[Any]) -> str:
+        """Build an expression rendering the parameter path, e.g. f'flight_data[{i3}].date'"""
+        template = ""
+        has_index = False
+        for part in path:
+            if isinstance(part, tuple):
+                template += "[{" + part[1] + "}]"
+                has_index = True
+            else:
+                escaped = str(part).replace("{", "{{").replace("}", "}}")
+                template += f".{escaped}" if template else escaped
+        if not has_index:
+            return repr(template.replace("{{", "{").replace("}}", "}"))
+        return "f" + repr(template)
+
+    def _emit_error(self, out: List[str], path: List[Any], message_expr: str, indent: int) -> None:
+        pad = "    " * indent
+        out.append(f"{pad}errors.append({{\"path\": {self._path_expr(path)}, \"message\": {message_expr}}})")
+
+    def _emit_field(self, out: List[str], var: str, info: Dict[str, Any], path: List[Any],
+                    required: bool, indent: int) -> None:
+        """Emit presence check followed by the value checks for one field"""
+        pad = "    " * indent
+        if required:
+            out.append(f"{pad}if {var} is None:")
+            self._emit_error(out, path, "'is required'", indent + 1)
+            out.append(f"{pad}else:")
+        else:
+            out.append(f"{pad}if {var} is not None:")
+        before = len(out)
+        self._emit_value(out, var, info, path, required, indent + 1)
+        if len(out) == before:
+            out.append(f"{pad}    pass")
+
+    def _emit_value(self, out: List[str], var: str, info: Dict[str, Any], path: List[Any],
+                    required: bool, indent: int) -> None:
+        """Emit type check and constraint checks for a present value"""
+        pad = "    " * indent
+        json_type = self._resolve_type(info)
+        checks: List[Tuple[str, str]] = []
+
+        if json_type in _TYPE_CHECKS:
+            checks.append((_TYPE_CHECKS[json_type].format(v=var),
+                           f"'expected {json_type}, got ' + type({var}).__name__"))
+
+        if json_type == 'string':
+            if required:
+                checks.append((f"not {var}", "'must not be empty'"))
+            if info.get('minLength') is not None:
+                checks.append((f"len({var}) < {int(info['minLength'])}",
+                               f"'must be at least {int(info['minLength'])} characters'"))
+            if info.get('maxLength') is not None:
+                checks.append((f"len({var}) > {int(info['maxLength'])}",
+                               f"'must be at most {int(info['maxLength'])} characters'"))
+            if info.get('pattern'):
+                self._uses_re = True
+                pattern = self._add_constant("PATTERN", f"re.compile({info['pattern']!r})")
+                checks.append((f"{pattern}.search({var}) is None",
+                               f"'does not match pattern ' + {info['pattern']!r}"))
+        elif json_type in ('integer', 'number'):
+            if info.get('minimum') is not None:
+                checks.append((f"{var} < {info['minimum']!r}", f"'must be >= {info['minimum']}'"))
+            if info.get('maximum') is not None:
+                checks.append((f"{var} > {info['maximum']!r}", f"'must be <= {info['maximum']}'"))
+        elif json_type == 'array':
+            if required:
+                checks.append((f"not {var}", "'must not be empty'"))
+            if info.get('minItems') is not None:
+                checks.append((f"len({var}) < {int(info['minItems'])}",
+                               f"'must contain at least {int(info['minItems'])} items'"))
+            if info.get('maxItems') is not None:
+                checks.append((f"len({var}) > {int(info['maxItems'])}",
+                               f"'must contain at most {int(info['maxItems'])} items'"))
+
+        enum_values = info.get('enum')
+        if enum_values:
+            enum_const = self._add_constant(
+                "ENUM", "frozenset({" + ", ".join(repr(value) for value in enum_values) + "})")
+            allowed = ", ".join(str(value) for value in enum_values)
+            guard = "" if json_type in ('string', 'integer', 'number', 'boolean') \
+                else f"not isinstance({var}, {_HASHABLE_SCALARS}) or "
+            checks.append((f"{guard}{var} not in {enum_const}", repr('must be one of: ' + allowed)))
+
+        for index, (condition, message) in enumerate(checks):
+            keyword = "if" if index == 0 else "elif"
+            out.append(f"{pad}{keyword} {condition}:")
+            self._emit_error(out, path, message, indent + 1)
+
+        nested = self._nested_fields(info, json_type)
+        if json_type == 'array' and nested is not None:
+            item_info, item_fields = nested
+            keyword = "else" if checks else None
+            body_indent = indent + 1 if keyword else indent
+            if keyword:
+                out.append(f"{pad}else:")
+            index_var = self._new_var('i')
+            item_var = self._new_var('v')
+            item_path = path + [('index', index_var)]
+            body_pad = "    " * body_indent
+            out.append(f"{body_pad}for {index_var}, {item_var} in enumerate({var}):")
+            if item_fields is not None:
+                out.append(f"{body_pad}    if not isinstance({item_var}, dict):")
+                self._emit_error(out, item_path,
+                                 f"'expected object, got ' + type({item_var}).__name__", body_indent + 2)
+                out.append(f"{body_pad}        continue")
+                self._emit_object_fields(out, item_var, item_fields, item_path, body_indent + 1)
+            else:
+                self._emit_field(out, item_var, item_info, item_path, True, body_indent + 1)
+        elif json_type == 'object' and nested is not None:
+            _, fields = nested
+            if checks:
+                out.append(f"{pad}else:")
+                self._emit_object_fields(out, var, fields, path, indent + 1)
+            else:
+                self._emit_object_fields(out, var, fields, path, indent)
+
+    def _emit_object_fields(self, out: List[str], var: str, fields: List[Tuple[str, Dict[str, Any], bool]],
+                            path: List[Any], indent: int) -> None:
+        pad = "    " * indent
+        for field_name, field_info, field_required in fields:
+            field_var = self._new_var('v')
+            out.append(f"{pad}{field_var} = {var}.get({field_name!r})")
+            self._emit_field(out, field_var, field_info, path + [field_name], field_required, indent)
+
+    def _nested_fields(self, info: Dict[str, Any], json_type: Optional[str]):
+        """
+        Resolve nested structure for arrays and objects.
+        Returns (item_info, fields) where fields is a list of (name, info, required) or None.
+        """
+        class_structure = info.get('class_structure')
+        if json_type == 'array':
+            if isinstance(class_structure, dict) and class_structure:
+                # Array items are unpacked with item['field'], so every field is required
+                return None, self._structure_fields(class_structure, required=True)
+            items = info.get('items')
+            if isinstance(items, dict) and items:
+                if self._resolve_type(items) == 'object' and (items.get('properties') or items.get('class_structure')):
+                    return None, self._object_fields(items)
+                return items, None
+            return None
+        if json_type == 'object':
+            if isinstance(class_structure, dict) and class_structure:
+                # Object fields are unpacked with .get(field, default), so they are optional
+                return None, self._structure_fields(class_structure, required=False)
+            if isinstance(info.get('properties'), dict) and info['properties']:
+                return None, self._object_fields(info)
+        return None
+
+    def _object_fields(self, info: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any], bool]]:
+        if isinstance(info.get('class_structure'), dict) and info['class_structure']:
+            return self._structure_fields(info['class_structure'], required=False)
+        required = info.get('required')
+        required_names = set(required) if isinstance(required, list) else set()
+        fields = []
+        for name, field_info in info.get('properties', {}).items():
+            field_info = field_info if isinstance(field_info, dict) else {}
+            is_required = name in required_names or field_info.get('required') is True
+            fields.append((name, field_info, is_required))
+        return fields
+
+    def _structure_fields(self, class_structure: Dict[str, Any],
+                          required: bool) -> List[Tuple[str, Dict[str, Any], bool]]:
+        fields = []
+        for name, description in class_structure.items():
+            if isinstance(description, dict):
+                field_info = description
+                field_required = description.get('required', required)
+            else:
+                field_info = {'type': self._type_from_description(str(description))}
+                field_required = required
+            fields.append((name, field_info, field_required))
+        return fields
+
+    @staticmethod
+    def _type_from_description(description: str) -> Optional[str]:
+        """Extract the JSON type from a class_structure description like 'string - Flight date'"""
+        match = re.match(r"\s*([A-Za-z]+)", description)
+        if not match:
+            return None
+        return _TYPE_ALIASES.get(match.group(1).lower())
+
+    @staticmethod
+    def _resolve_type(info: Dict[str, Any]) -> Optional[str]:
+        json_type = info.get('type')
+        if isinstance(json_type, str):
+            return _TYPE_ALIASES.get(json_type.lower())
+        return None
@@ -5,6 +5,15 @@ from pathlib import Path
 from abc import ABC, abstractmethod
 
 
+# Style names LLMs commonly use for each supported pagination scheme
+PAGINATION_STYLE_ALIASES = {
+    "page": "page", "page_number": "page", "page_based": "page", "paged": "page",
+    "offset": "offset", "offset_limit": "offset", "limit_offset": "offset",
+    "cursor": "cursor", "cursor_based": "cursor", "token": "cursor", "next_token": "cursor",
+    "link_header": "link_header", "link": "link_header", "next_url": "link_header", "url": "link_header",
+}
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
@@ -389,9 +398,51 @@ class InputParser:
             "error_handling": parsed.get("error_handling", {}),
             "usage_examples": parsed.get("usage_examples", []),
             "tool_metadata": parsed.get("tool_metadata", {}),
+            "pagination": self._standardize_pagination(parsed.get("pagination")),
+            "rate_limit": self._standardize_rate_limit(parsed.get("rate_limit")),
             "usage_info": {"llm_extracted": True}
         }
 
+    def _standardize_rate_limit(self, rate_limit: Any) -> Optional[Dict[str, Any]]:
+        """Convert the LLM's "N requests per period" quota into requests_per_second; None when unknown"""
+        if not isinstance(rate_limit, dict):
+            return None
+        try:
+            requests_count = float(rate_limit.get("requests"))
+            period_seconds = float(rate_limit.get("period_seconds") or 1)
+        except (TypeError, ValueError):
+            return None
+        if requests_count <= 0 or period_seconds <= 0:
+            return None
+        standardized = {"requests_per_second": requests_count / period_seconds}
+        try:
+            if rate_limit.get("burst") is not None:
+                standardized["burst"] = max(1, int(rate_limit["burst"]))
+        except (TypeError, ValueError):
+            pass
+        return standardized
+
+    def _standardize_pagination(self, pagination: Any) -> Optional[Dict[str, Any]]:
+        """Normalize the LLM's pagination description; None when the API is not paginated"""
+        if not isinstance(pagination, dict):
+            return None
+        style = str(pagination.get("style") or "").strip().lower().replace("-", "_").replace(" ", "_")
+        style = PAGINATION_STYLE_ALIASES.get(style)
+        if style is None:
+            return None
+        standardized = {"style": style}
+        for field in ("items_field", "page_param", "offset_param", "size_param", "cursor_param",
+                      "next_cursor_field", "next_url_field", "total_field", "total_pages_field"):
+            if isinstance(pagination.get(field), str) and pagination[field]:
+                standardized[field] = pagination[field]
+        for field in ("page_size", "start_page"):
+            try:
+                if pagination.get(field) is not None:
+                    standardized[field] = int(pagination[field])
+            except (TypeError, ValueError):
+                pass
+        return standardized
+
 
 
  
\ No newline at end of file
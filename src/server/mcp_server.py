@@ -5,6 +5,8 @@ Compatible with LangChain MCP Adapters: https://github.com/langchain-ai/langchai
 """
 
 import asyncio
+import functools
+import inspect
 import json
 import logging
 from typing import Any, Dict, List, Optional
@@ -57,6 +59,11 @@ class MCPServer:
         """Discover and load all MCP tools from the tool registry"""
         registry_path = self.tools_directory / "tool_registry.json"
         
+        # Generated tools import the shared _runtime package from the tools directory
+        tools_root = str(self.tools_directory.resolve())
+        if tools_root not in sys.path:
+            sys.path.insert(0, tools_root)
+        
         if not registry_path.exists():
             logger.warning(f"Tool registry not found at {registry_path}")
             logger.info("Falling back to file scanning...")
@@ -89,25 +96,28 @@ class MCPServer:
         if not tool_file.exists():
             raise FileNotFoundError(f"Tool file not found: {tool_file}")
         
-        # Import the module
-        module_name = f"{tool_info['directory']}_tool"
-        spec = importlib.util.spec_from_file_location(module_name, tool_file)
-        if spec is None or spec.loader is None:
-            raise ValueError(f"Could not load spec for {tool_file}")
+        # Import the module: as part of the tools package when there is one, else by file path
+        if (self.tools_directory / "__init__.py").exists():
+            module = self._import_tool_package_module(tool_info["directory"])
+        else:
+            module_name = f"{tool_info['directory']}_tool"
+            spec = importlib.util.spec_from_file_location(module_name, tool_file)
+            if spec is None or spec.loader is None:
+                raise ValueError(f"Could not load spec for {tool_file}")
+                
+            module = importlib.util.module_from_spec(spec)
             
-        module = importlib.util.module_from_spec(spec)
-        
-        # Add the tool directory to sys.path temporarily
-        tool_dir_str = str(tool_dir)
-        if tool_dir_str not in sys.path:
-            sys.path.insert(0, tool_dir_str)
-        
-        try:
-            spec.loader.exec_module(module)
-        finally:
-            # Remove from sys.path
-            if tool_dir_str in sys.path:
-                sys.path.remove(tool_dir_str)
+            # Add the tool directory to sys.path temporarily
+            tool_dir_str = str(tool_dir)
+            if tool_dir_str not in sys.path:
+                sys.path.insert(0, tool_dir_str)
+            
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                # Remove from sys.path
+                if tool_dir_str in sys.path:
+                    sys.path.remove(tool_dir_str)
         
         # Find the tool class (should match the tool name)
         tool_class = getattr(module, tool_name, None)
@@ -150,6 +160,14 @@ class MCPServer:
         
         logger.info(f"Loaded tool from registry: {tool_instance.name}")
     
+    def _import_tool_package_module(self, directory: str) -> Any:
+        """Import <tools package>.<directory>.tool, putting the package's parent directory on sys.path"""
+        tools_directory = self.tools_directory.resolve()
+        parent_dir = str(tools_directory.parent)
+        if parent_dir not in sys.path:
+            sys.path.insert(0, parent_dir)
+        return importlib.import_module(f"{tools_directory.name}.{directory}.tool")
+    
     def _convert_schema_for_langchain(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convert tool parameter schema to be fully compatible with LangChain MCP adapters
@@ -245,8 +263,9 @@ class MCPServer:
         """Return list of available tools for MCP protocol"""
         return list(self.tool_schemas.values())
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool with given arguments"""
+    async def call_tool(self, name: str, arguments: Dict[str, Any],
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Execute a tool with given arguments, within timeout seconds when the tool supports deadlines"""
         if name not in self.tools:
             raise ValueError(f"Tool '{name}' not found")
         
@@ -256,9 +275,14 @@ class MCPServer:
         if not tool.validate(arguments):
             raise ValueError(f"Invalid arguments for tool '{name}'")
         
-        # Execute the tool
+        # Execute the tool off the event loop so slow or pooled tools don't block other requests
         try:
-            result = tool.run(arguments)
+            loop = asyncio.get_running_loop()
+            if timeout is not None and self._supports_timeout(tool):
+                run = functools.partial(tool.run, arguments, timeout=timeout)
+            else:
+                run = functools.partial(tool.run, arguments)
+            result = await loop.run_in_executor(None, run)
             return {
                 "content": [
                     {
@@ -274,6 +298,26 @@ class MCPServer:
     def get_tool_info(self, name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific tool"""
         return self.tool_schemas.get(name)
+    
+    @staticmethod
+    def _supports_timeout(tool: Any) -> bool:
+        """Generated tools accept run(params, timeout=...); legacy tools only take params"""
+        try:
+            return "timeout" in inspect.signature(tool.run).parameters
+        except (TypeError, ValueError):
+            return False
+    
+    def runtime_stats(self) -> Dict[str, Any]:
+        """Collect runtime counters (cache, workers, circuit breakers) from every loaded tool"""
+        stats = {}
+        for name, tool in self.tools.items():
+            runtime_stats = getattr(tool, "runtime_stats", None)
+            if callable(runtime_stats):
+                try:
+                    stats[name] = runtime_stats()
+                except Exception as e:
+                    logger.debug(f"Could not read runtime stats of {name}: {e}")
+        return {"tools": stats}
 
 
 class SimpleStdioMCPServer:
@@ -299,6 +343,8 @@ class SimpleStdioMCPServer:
                 tool_name = params.get("name")
                 arguments = params.get("arguments", {})
                 result = await self.mcp_server.call_tool(tool_name, arguments)
+            elif method == "runtime/stats":
+                result = self.mcp_server.runtime_stats()
             else:
                 raise ValueError(f"Unknown method: {method}")
             
@@ -1,21 +1,75 @@
 import json
-from typing import Any, Callable, Dict, Type
-from dataclasses import is_dataclass, asdict
+from itertools import compress
+from operator import not_
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from dataclasses import is_dataclass, fields
+
+# Types that are already JSON-compatible leaves
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Dispatch kinds resolved once per type
+_LEAF, _DICT, _LIST, _SEQUENCE, _DATACLASS, _OBJECT, _PLUGIN = range(7)
+
+
+def _is_flat(container: Any) -> bool:
+    """True when every value of a dict or list is a JSON scalar (checked at C speed)"""
+    return _SCALARS.issuperset(map(type, container.values() if isinstance(container, dict) else container))
+
+
+def _is_plain(root: Any) -> bool:
+    """True when root is made of dicts, lists and JSON scalars only; the per-item work runs in C"""
+    pending = [root]
+    while pending:
+        container = pending.pop()
+        values = container.values() if type(container) is dict else container
+        for nested in compress(values, map(not_, map(_SCALARS.__contains__, map(type, values)))):
+            if type(nested) is not dict and type(nested) is not list:
+                return False
+            pending.append(nested)
+    return True
+
+
+class _Frame:
+    """A container being rebuilt; it is only copied once one of its children actually changes"""
+    __slots__ = ("original", "source", "key", "items", "result")
+
+    def __init__(self, original: Any, source: Any, key: Any):
+        self.original = original
+        self.source = source  # the value as found in the parent, before conversion
+        self.key = key
+        self.items = iter(original.items()) if isinstance(original, dict) else enumerate(original)
+        self.result = None
+
+    def replace(self, key: Any, value: Any) -> None:
+        if self.result is None:
+            self.result = dict(self.original) if isinstance(self.original, dict) else list(self.original)
+        self.result[key] = value
+
+    def finish(self) -> Any:
+        return self.original if self.result is None else self.result
+
 
 class Normalizer:
     """
     Normalizes API responses (dataclass, dict, JSON string) into Python dictionaries and serializes to JSON.
     Supports plugin-based extensibility for new response formats.
+
+    Plugins are registered per type (matched along the MRO, so subclasses inherit them) or,
+    for backwards compatibility, per type name. Name keys may be qualified ("module.QualName")
+    so a converter can be registered without importing the module that defines the type.
+    The handler of each type is resolved once and cached.
     """
     _registry: Dict[str, Callable[[Any], Any]] = {}
+    _type_registry: Dict[type, Callable[[Any], Any]] = {}
+    _dispatch: Dict[type, Tuple[int, Optional[Callable[[Any], Any]]]] = {}
 
     def normalize(self, obj: Any) -> Dict[str, Any]:
         """
         Main normalize method that converts any object to a normalized dictionary
-        
+
         Args:
             obj: Object to normalize (dataclass, dict, JSON string, etc.)
-            
+
         Returns:
             Normalized dictionary representation
         """
@@ -26,48 +80,134 @@ class Normalizer:
         return normalized
 
     @classmethod
-    def register(cls, type_name: str, normalizer_fn: Callable[[Any], Any]):
-        """Register a new normalizer function for a given type name."""
-        cls._registry[type_name] = normalizer_fn
+    def register(cls, type_or_name: Union[type, str], normalizer_fn: Callable[[Any], Any]):
+        """Register a new normalizer function for a type, a type name or a qualified type name."""
+        if isinstance(type_or_name, type):
+            cls._type_registry[type_or_name] = normalizer_fn
+        else:
+            cls._registry[type_or_name] = normalizer_fn
+        cls._dispatch.clear()
+
+    @classmethod
+    def _resolve(cls, obj_type: type) -> Tuple[int, Optional[Callable[[Any], Any]]]:
+        """Find how values of obj_type are normalized; the answer is cached per type"""
+        entry = cls._dispatch.get(obj_type)
+        if entry is not None:
+            return entry
+        plugin = None
+        for klass in obj_type.__mro__:
+            plugin = cls._type_registry.get(klass) or cls._registry.get(f"{klass.__module__}.{klass.__qualname__}")
+            if plugin is not None:
+                break
+        if plugin is None:
+            plugin = cls._registry.get(obj_type.__name__)
+        if plugin is not None:
+            entry = (_PLUGIN, plugin)
+        elif is_dataclass(obj_type):
+            entry = (_DATACLASS, None)
+        elif issubclass(obj_type, dict):
+            entry = (_DICT, None)
+        elif issubclass(obj_type, list):
+            entry = (_LIST, None)
+        elif issubclass(obj_type, (tuple, set, frozenset)):
+            entry = (_SEQUENCE, None)
+        elif issubclass(obj_type, (str, int, float, bytes)):
+            entry = (_LEAF, None)
+        else:
+            entry = (_OBJECT, None)
+        cls._dispatch[obj_type] = entry
+        return entry
+
+    @classmethod
+    def _convert(cls, obj: Any) -> Any:
+        """Convert one value one level down (no recursion); containers come back as dict or list"""
+        kind, plugin = cls._resolve(type(obj))
+        if kind == _PLUGIN:
+            return plugin(obj)
+        if kind == _DATACLASS:
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        if kind == _SEQUENCE:
+            return list(obj)
+        if kind == _OBJECT:
+            attributes = getattr(obj, "__dict__", None)
+            if attributes:
+                return dict(attributes)
+        return obj
+
+    @classmethod
+    def _shape(cls, value: Any) -> Any:
+        """Convert value until it is a JSON scalar, a dict or a list, or cannot be converted further"""
+        value_type = type(value)
+        while value_type not in _SCALARS and value_type is not dict and value_type is not list:
+            converted = cls._convert(value)
+            if converted is value or type(converted) is value_type:
+                break
+            value, value_type = converted, type(converted)
+        return value
+
+    @classmethod
+    def _deep(cls, root: Any) -> Any:
+        """
+        Normalize root and everything below it with an explicit stack, so depth is bounded by
+        memory rather than the recursion limit. Containers that need no change are returned
+        as they are, so plain JSON-compatible payloads are walked once and never copied.
+        """
+        if (type(root) is dict or type(root) is list) and _is_plain(root):
+            return root
+        value = cls._shape(root)
+        if not isinstance(value, (dict, list)) or _is_flat(value):
+            return value
+        stack = [_Frame(value, root, None)]
+        active = {id(value)}
+        while True:
+            frame = stack[-1]
+            child = next(frame.items, None)
+            if child is None:
+                stack.pop()
+                active.discard(id(frame.original))
+                result = frame.finish()
+                if not stack:
+                    return result
+                if result is not frame.source:
+                    stack[-1].replace(frame.key, result)
+                continue
+            key, item = child
+            if type(item) in _SCALARS:
+                continue
+            shaped = cls._shape(item)
+            if isinstance(shaped, (dict, list)) and not _is_flat(shaped):
+                if id(shaped) in active:
+                    raise ValueError("Circular reference detected during normalization")
+                active.add(id(shaped))
+                stack.append(_Frame(shaped, item, key))
+            elif shaped is not item:  # converted leaf, or a container of scalars only
+                frame.replace(key, shaped)
 
     @classmethod
     def to_dict(cls, obj: Any) -> Any:
         """
         Convert dataclass, dict, or JSON string to a Python dictionary.
-        Handles nested dataclasses and lists. Uses plugins if registered.
+        Handles nested dataclasses, dicts, lists and tuples at any depth. Uses plugins if registered.
         """
-        # Plugin/registry dispatch
-        obj_type = type(obj).__name__
-        if obj_type in cls._registry:
-            return cls._registry[obj_type](obj)
-        if is_dataclass(obj):
-            return asdict(obj)
-        if isinstance(obj, dict):
-            return obj
-        if isinstance(obj, str):
+        if type(obj) is str:
             try:
                 return json.loads(obj)
-            except Exception:
-                pass  # Not a JSON string
-        if isinstance(obj, list):
-            return [cls.to_dict(item) for item in obj]
-        if hasattr(obj, "__dict__") and obj.__dict__:
-            return dict(obj.__dict__)
-        return obj  # Return as-is if cannot normalize
-
-    @staticmethod
-    def to_json(obj: Any) -> str:
+            except ValueError:
+                return obj  # Not a JSON string
+        return cls._deep(obj)
+
+    @classmethod
+    def to_json(cls, obj: Any) -> str:
         """
         Serialize normalized object to JSON string.
         Handles non-serializable objects by converting them to strings.
         """
         def default(o):
-            if is_dataclass(o):
-                return asdict(o)
-            if hasattr(o, "__dict__") and o.__dict__:
-                return dict(o.__dict__)
-            return str(o)
+            converted = cls._convert(o)
+            if converted is o:
+                return str(o)
+            return converted
         try:
             return json.dumps(obj, default=default)
         except Exception as e:
-            raise ValueError(f"Could not serialize object to JSON: {e}") 
\ No newline at end of file
+            raise ValueError(f"Could not serialize object to JSON: {e}")
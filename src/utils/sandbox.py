@@ -78,6 +78,62 @@ except Exception as e:
         error_msg = result.stderr or result.stdout or "Unknown execution error"
         raise RuntimeError(f"Code execution failed: {error_msg}")
 
+    def profile_tool(self, tool_file: str, class_name: str, sample_params: Optional[Dict[str, Any]] = None,
+                     iterations: int = 1000) -> Dict[str, Any]:
+        """
+        Import a generated tool in a fresh interpreter and measure its cold import time and
+        validate() latency. Worker pools are not started while profiling.
+        
+        Args:
+            tool_file: Path to the generated tool.py
+            class_name: Name of the tool class in the module
+            sample_params: Parameters passed to validate()
+            iterations: Number of timed validate() calls
+            
+        Returns:
+            Dict with import_ms, validate_us and validate_iterations
+        """
+        tool_path = os.path.abspath(tool_file)
+        tools_root = os.path.dirname(os.path.dirname(tool_path))
+        
+        profile_code = f'''
+import importlib.util
+import json
+import sys
+import time
+
+sys.path.insert(0, {tools_root!r})
+
+try:
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location("profiled_tool", {tool_path!r})
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    import_ms = (time.perf_counter() - start) * 1000
+    
+    tool = getattr(module, {class_name!r})()
+    params = json.loads({json.dumps(sample_params or {})!r})
+    tool.validate(params)
+    start = time.perf_counter()
+    for _ in range({int(iterations)}):
+        tool.validate(params)
+    validate_us = (time.perf_counter() - start) / {int(iterations)} * 1e6
+    
+    print("SANDBOX_RESULT:", json.dumps({{"import_ms": round(import_ms, 3), "validate_us": round(validate_us, 3),
+                                          "validate_iterations": {int(iterations)}}}))
+except Exception as e:
+    print("SANDBOX_ERROR:", f"{{type(e).__name__}}: {{e}}")
+'''
+        
+        # MCP_TOOL_WORKER keeps the tool from starting a warm worker pool on import
+        result = self.run_python_code(profile_code, env={"MCP_TOOL_WORKER": "1"})
+        for line in result.stdout.split('\n'):
+            if line.startswith("SANDBOX_RESULT:"):
+                return json.loads(line.replace("SANDBOX_RESULT:", "").strip())
+        
+        error_msg = result.stderr or result.stdout or "Unknown execution error"
+        raise RuntimeError(f"Profiling {tool_file} failed: {error_msg.strip()}")
+
     def run_python_code(self, code: str, env: Optional[Dict[str, str]] = None) -> SandboxResult:
         """
         Run Python code in a subprocess with restricted environment.
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.conditional import ValidatorCache
+from generators.runtime.transport import accept_encoding
+
+
+class TestValidatorCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = ValidatorCache(self.directory, max_entries=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_key_depends_on_params_and_headers(self):
+        key = ValidatorCache.make_key("https://api/x", {"a": 1, "b": 2}, {"X-API-Key": "k1"})
+        self.assertEqual(key, ValidatorCache.make_key("https://api/x", {"b": 2, "a": 1}, {"X-API-Key": "k1"}))
+        self.assertNotEqual(key, ValidatorCache.make_key("https://api/x", {"a": 1, "b": 2}, {"X-API-Key": "k2"}))
+
+    def test_store_revalidate_and_load(self):
+        key = ValidatorCache.make_key("https://api/x", None, None)
+        self.assertEqual(self.cache.conditional_headers(key), {})
+        self.assertTrue(self.cache.store(key, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                                               "Content-Type": "application/json"}, b'{"ok": true}'))
+        self.assertEqual(self.cache.conditional_headers(key), {
+            "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        meta, body = self.cache.load(key)
+        self.assertEqual(body, b'{"ok": true}')
+        self.assertEqual(meta["content_type"], "application/json")
+        stats = self.cache.stats()
+        self.assertEqual(stats["not_modified"], 1)
+        self.assertEqual(stats["bytes_saved"], len(body))
+
+    def test_responses_without_validators_are_not_stored(self):
+        self.assertFalse(self.cache.store("k", {"Content-Type": "application/json"}, b"{}"))
+        self.assertIsNone(self.cache.load("k"))
+
+    def test_evicts_least_recently_used(self):
+        for name in ("a", "b"):
+            self.cache.store(name, {"ETag": name}, name.encode())
+            time.sleep(0.01)
+        self.cache.load("a")  # "b" is now the least recently used
+        time.sleep(0.01)
+        self.cache.store("c", {"ETag": "c"}, b"c")
+        self.assertEqual(sorted(f for f in os.listdir(self.directory) if f.endswith(".json")),
+                         ["a.json", "c.json"])
+
+    def test_accept_encoding_always_offers_gzip(self):
+        self.assertTrue(accept_encoding().startswith("gzip, deflate"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -93,5 +93,54 @@ class TestNormalizer(unittest.TestCase):
         result = Normalizer.to_dict(c)
         self.assertEqual(result, {"custom": "foo"})
 
+    def test_same_name_types_do_not_collide(self):
+        class Point:
+            def __init__(self):
+                self.x = 1
+
+        OtherPoint = type("Point", (), {"__init__": lambda self: setattr(self, "y", 2)})
+        Normalizer.register(Point, lambda obj: {"point": obj.x})
+        self.assertEqual(Normalizer.to_dict(Point()), {"point": 1})
+        self.assertEqual(Normalizer.to_dict(OtherPoint()), {"y": 2})
+
+    def test_subclass_uses_registered_base_converter(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        Normalizer.register(Base, lambda obj: {"kind": type(obj).__name__})
+        self.assertEqual(Normalizer.to_dict(Child()), {"kind": "Child"})
+
+    def test_nested_dataclasses_inside_dicts_and_tuples(self):
+        data = {"cities": (Weather(city="London", temp=20.5),), "meta": {"best": Weather(city="Paris", temp=22.0)}}
+        self.assertEqual(Normalizer.to_dict(data), {
+            "cities": [{"city": "London", "temp": 20.5}],
+            "meta": {"best": {"city": "Paris", "temp": 22.0}}
+        })
+        self.assertIsInstance(data["cities"], tuple)  # input is not modified
+
+    def test_plain_json_is_returned_without_copy(self):
+        data = {"a": [1, 2, {"b": None}], "c": "d"}
+        self.assertIs(Normalizer.to_dict(data), data)
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        data = leaf = {}
+        for _ in range(sys.getrecursionlimit() * 2):
+            leaf["child"] = {}
+            leaf = leaf["child"]
+        leaf["weather"] = Weather(city="Oslo", temp=1.0)
+        result = Normalizer.to_dict(data)
+        while "child" in result:
+            result = result["child"]
+        self.assertEqual(result["weather"], {"city": "Oslo", "temp": 1.0})
+
+    def test_circular_reference_raises(self):
+        data = {"items": []}
+        data["items"].append(data)
+        with self.assertRaises(ValueError):
+            Normalizer.to_dict(data)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
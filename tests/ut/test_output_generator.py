@@ -2,6 +2,8 @@ import unittest
 import os
 import json
 import sys
+import shutil
+import importlib.util
 from pathlib import Path
 
 # Add src to path
@@ -40,5 +42,189 @@ class TestOutputGenerator(unittest.TestCase):
             loaded = json.load(f)
         self.assertEqual(loaded, self.data)
 
+
+class TestGeneratedToolClass(unittest.TestCase):
+    def setUp(self):
+        self.tool_dir = "tests/tmp/generated/demotool"
+        self.tool_file = os.path.join(self.tool_dir, "tool.py")
+        self.schema = {
+            "city": {"type": "string", "required": True},
+            "units": {"type": "string", "required": False, "enum": ["metric", "imperial"], "default": "metric"},
+            "days": {"type": "integer", "required": False, "default": 1}
+        }
+        self.parsed_data = {
+            "api_type": "python_package",
+            "package_name": "builtins",
+            "main_function": {"name": "dict", "import_statement": "from builtins import dict"}
+        }
+
+    def tearDown(self):
+        shutil.rmtree("tests/tmp/generated", ignore_errors=True)
+
+    def _load_tool_module(self):
+        tools_root = str(Path("tests/tmp/generated").resolve())
+        if tools_root not in sys.path:
+            sys.path.insert(0, tools_root)
+        spec = importlib.util.spec_from_file_location("demotool_tool", self.tool_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    def test_python_package_tool_is_importable(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        module = self._load_tool_module()
+        tool = module.DemoTool()
+        self.assertEqual(tool.parameters_schema, self.schema)
+        self.assertTrue(tool.validate({"city": "London"}))
+
+    def test_generated_validation_errors(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        tool = self._load_tool_module().DemoTool()
+        self.assertFalse(tool.validate({"units": "kelvin", "days": "2"}))
+        self.assertEqual(tool.validation_errors({"units": "kelvin", "days": "2"}), [
+            {"path": "city", "message": "is required"},
+            {"path": "units", "message": "must be one of: metric, imperial"},
+            {"path": "days", "message": "expected integer, got str"}
+        ])
+
+    def test_response_cache_from_metadata(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        OutputGenerator.write_json({"runtime": {"cache": {"enabled": True, "ttl_seconds": 60}}},
+                                   os.path.join(self.tool_dir, "metadata.json"))
+        tool = self._load_tool_module().DemoTool()
+        first = tool.run({"city": "London", "units": "metric", "days": 1})
+        second = tool.run({"days": 1, "units": "metric", "city": "London"})
+        self.assertEqual(first, {"city": "London", "units": "metric", "days": 1})
+        self.assertIs(first, second)
+        stats = tool.runtime_stats()["cache"]
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_response_cache_disabled_by_default(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        tool = self._load_tool_module().DemoTool()
+        self.assertEqual(tool.run({"city": "Paris"}), {"city": "Paris", "units": "metric", "days": 1})
+        self.assertIsNone(tool.runtime_stats()["cache"])
+
+    def test_worker_pool_from_metadata(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        OutputGenerator.write_json({"runtime": {"workers": {"enabled": True, "pool_size": 1}}},
+                                   os.path.join(self.tool_dir, "metadata.json"))
+        module = self._load_tool_module()
+        try:
+            result = module.DemoTool().run({"city": "Oslo"})
+            self.assertEqual(result, {"city": "Oslo", "units": "metric", "days": 1})
+            self.assertEqual(module.DemoTool().runtime_stats()["workers"]["calls"], 1)
+        finally:
+            module.RUNTIME.worker_pool.shutdown()
+
+    def test_circuit_breaker_from_metadata(self):
+        parsed_data = dict(self.parsed_data, package_name="breakerdemo",
+                           main_function={"name": "int", "import_statement": "from builtins import int"})
+        schema = {"city": {"type": "string", "required": True}}
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", schema, {"ok": True},
+                                              "", self.tool_file, parsed_data)
+        OutputGenerator.write_json({"runtime": {"timeout_seconds": 5, "circuit_breaker": {
+            "enabled": True, "failure_threshold": 2, "recovery_timeout_seconds": 60}}},
+            os.path.join(self.tool_dir, "metadata.json"))
+        tool = self._load_tool_module().DemoTool()
+        # int(city="Oslo") fails inside the call function, which reports it as an error dict
+        for _ in range(2):
+            self.assertIn("error", tool.run({"city": "Oslo"}))
+        result = tool.run({"city": "Oslo"})
+        self.assertIn("circuit breaker is open", result["error"])
+        breaker = tool.runtime_stats()["circuit_breakers"]["package:breakerdemo"]
+        self.assertEqual(breaker["state"], "open")
+        self.assertEqual(breaker["rejected"], 1)
+
+    def test_run_many_preserves_order_and_reports_errors(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        tool = self._load_tool_module().DemoTool()
+        cities = [f"City{i}" for i in range(20)]
+        params_list = [{"city": city} for city in cities]
+        params_list.insert(5, {"city": 42})
+        results = tool.run_many(params_list, max_concurrency=4)
+        self.assertEqual(len(results), 21)
+        self.assertEqual(results[5]["ok"], False)
+        self.assertEqual(results[5]["errors"], [{"path": "city", "message": "expected string, got int"}])
+        ok_cities = [r["result"]["city"] for r in results if r["ok"]]
+        self.assertEqual(ok_cities, cities)
+
+    def test_runtime_package_is_shared(self):
+        generator = OutputGenerator()
+        generator.generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                      "", self.tool_file, self.parsed_data)
+        runtime_dir = Path("tests/tmp/generated/_runtime")
+        self.assertTrue((runtime_dir / "__init__.py").exists())
+        with open(self.tool_file) as f:
+            source = f.read()
+        self.assertIn("from _runtime import", source)
+        self.assertNotIn("class ResponseCache", source)
+        # Regenerating leaves unchanged runtime files alone
+        mtime = (runtime_dir / "cache.py").stat().st_mtime_ns
+        generator.write_runtime_package("tests/tmp/generated")
+        self.assertEqual((runtime_dir / "cache.py").stat().st_mtime_ns, mtime)
+
+    def test_wrapper_loads_tool(self):
+        generator = OutputGenerator()
+        generator.generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                      "", self.tool_file, self.parsed_data)
+        wrapper_file = os.path.join(self.tool_dir, "wrapper.py")
+        generator.generate_wrapper("DemoTool", Path(self.tool_file), wrapper_file)
+        spec = importlib.util.spec_from_file_location("demotool_wrapper", wrapper_file)
+        wrapper = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(wrapper)
+        self.assertEqual(wrapper.run_demotool(city="Oslo"), {"city": "Oslo", "units": "metric", "days": 1})
+
+    def test_generated_module_is_precompiled(self):
+        OutputGenerator().generate_tool_class("DemoTool", "Demo tool", self.schema, {"ok": True},
+                                              "", self.tool_file, self.parsed_data)
+        self.assertTrue(os.path.exists(importlib.util.cache_from_source(os.path.abspath(self.tool_file))))
+
+    def test_compile_module_rejects_broken_source(self):
+        os.makedirs(self.tool_dir, exist_ok=True)
+        with open(self.tool_file, "w") as f:
+            f.write("def broken(:\n    pass\n")
+        with self.assertRaises(ValueError):
+            OutputGenerator.compile_module(self.tool_file)
+
+    def test_tools_package_resolves_tools_lazily(self):
+        generator = OutputGenerator()
+        for name in ("LazyOne", "LazyTwo"):
+            generator.generate_tool_class(name, "Demo tool", self.schema, {"ok": True}, "",
+                                          f"tests/tmp/lazytools/{name.lower()}/tool.py", self.parsed_data)
+            generator.generate_wrapper(name, Path("tool.py"), f"tests/tmp/lazytools/{name.lower()}/wrapper.py")
+        sys.path.insert(0, str(Path("tests/tmp").resolve()))
+        try:
+            package = importlib.import_module("lazytools")
+            self.assertNotIn("lazytools.lazyone.tool", sys.modules)
+            tool_class = package.LazyOne
+            self.assertEqual(tool_class().run({"city": "Oslo"}), {"city": "Oslo", "units": "metric", "days": 1})
+            self.assertIn("lazytools.lazyone.tool", sys.modules)
+            self.assertNotIn("lazytools.lazytwo.tool", sys.modules)
+            with self.assertRaises(AttributeError):
+                package.NoSuchTool
+
+            wrapper = importlib.import_module("lazytools.lazytwo.wrapper")
+            self.assertIs(wrapper.LazyTwo, package.LazyTwo)
+            self.assertIsInstance(wrapper._TOOL, package.LazyTwo)
+            self.assertEqual(wrapper.run_lazytwo(city="Rome")["city"], "Rome")
+        finally:
+            sys.path.remove(str(Path("tests/tmp").resolve()))
+            for module_name in [m for m in sys.modules if m == "lazytools" or m.startswith("lazytools.")]:
+                del sys.modules[module_name]
+            shutil.rmtree("tests/tmp/lazytools", ignore_errors=True)
+
+    def test_rest_tool_compiles(self):
+        OutputGenerator().generate_tool_class("RestDemo", "Demo tool", self.schema, {"ok": True}, "",
+                                              self.tool_file, {"base_url": "https://api.example.com"})
+        with open(self.tool_file) as f:
+            compile(f.read(), self.tool_file, "exec")
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,103 @@
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.pagination import Paginator
+
+
+def page_api(total_items, page_size, delay=0.0):
+    """Fake page-numbered endpoint returning {"data": [...], "total": n}"""
+    calls = []
+    active = [0, 0]  # current, peak concurrent calls
+    lock = threading.Lock()
+
+    def fetch(page_params, page_url):
+        with lock:
+            calls.append(dict(page_params))
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(delay)
+        page = page_params.get("page", 1)
+        start = (page - 1) * page_size
+        data = list(range(start, min(start + page_size, total_items)))
+        with lock:
+            active[0] -= 1
+        return {"data": data, "total": total_items}, None
+
+    return fetch, calls, active
+
+
+class TestPaginator(unittest.TestCase):
+    def test_page_style_with_total_fetches_concurrently(self):
+        fetch, calls, active = page_api(95, 10, delay=0.02)
+        paginator = Paginator({"style": "page", "items_field": "data", "size_param": "per_page",
+                               "page_size": 10, "total_field": "total", "max_concurrency": 4})
+        result = paginator.collect(fetch)
+        self.assertEqual(result["data"], list(range(95)))
+        self.assertEqual(result["total"], 95)
+        self.assertEqual(paginator.pages_fetched, 10)
+        self.assertTrue(paginator.complete)
+        self.assertEqual(calls[0], {"page": 1, "per_page": 10})
+        self.assertGreater(active[1], 1)
+
+    def test_page_style_without_total_stops_on_short_page(self):
+        fetch, calls, _ = page_api(25, 10)
+        paginator = Paginator({"style": "page", "items_field": "data", "page_size": 10,
+                               "max_concurrency": 2})
+        self.assertEqual(paginator.collect(fetch)["data"], list(range(25)))
+        self.assertTrue(paginator.complete)
+
+    def test_max_pages_and_max_items(self):
+        fetch, _, _ = page_api(1000, 10)
+        paginator = Paginator({"style": "page", "items_field": "data", "page_size": 10, "max_pages": 3})
+        self.assertEqual(len(paginator.collect(fetch)["data"]), 30)
+        self.assertFalse(paginator.complete)
+
+        paginator = Paginator({"style": "page", "items_field": "data", "page_size": 10, "max_items": 15})
+        self.assertEqual(paginator.collect(fetch)["data"], list(range(15)))
+        self.assertFalse(paginator.complete)
+
+    def test_offset_style(self):
+        def fetch(page_params, page_url):
+            offset = page_params["offset"]
+            return list(range(offset, min(offset + 5, 12))), None
+
+        paginator = Paginator({"style": "offset", "page_size": 5})
+        self.assertEqual(paginator.collect(fetch), list(range(12)))
+
+    def test_cursor_style(self):
+        pages = {None: (["a", "b"], "c1"), "c1": (["c"], "c2"), "c2": (["d"], None)}
+
+        def fetch(page_params, page_url):
+            items, next_cursor = pages[page_params.get("cursor")]
+            return {"results": {"items": items}, "meta": {"next": next_cursor}}, None
+
+        paginator = Paginator({"style": "cursor", "items_field": "results.items",
+                               "next_cursor_field": "meta.next"})
+        result = paginator.collect(fetch)
+        self.assertEqual(result["results"]["items"], ["a", "b", "c", "d"])
+        self.assertEqual(paginator.pages_fetched, 3)
+        self.assertTrue(paginator.complete)
+
+    def test_link_header_style(self):
+        pages = {None: ([1, 2], "https://api/p2"), "https://api/p2": ([3], None)}
+
+        def fetch(page_params, page_url):
+            items, next_url = pages[page_url]
+            return items, next_url
+
+        paginator = Paginator({"style": "link_header"})
+        self.assertEqual(paginator.collect(fetch), [1, 2, 3])
+
+    def test_unknown_style_rejected(self):
+        with self.assertRaises(ValueError):
+            Paginator({"style": "magic"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.ratelimit import (FileTokenBucket, LimiterRegistry, RateLimitExceeded,
+                                          TokenBucket, retry_after_seconds)
+from generators.runtime.transport import HttpTransport
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_retry_after_seconds_and_date(self):
+        self.assertEqual(retry_after_seconds({"Retry-After": "7"}), 7.0)
+        self.assertAlmostEqual(retry_after_seconds({"Retry-After": "Thu, 01 Jan 1970 00:01:40 GMT"}, now=40.0), 60.0)
+
+    def test_ratelimit_reset_headers(self):
+        self.assertIsNone(retry_after_seconds({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "10"}))
+        self.assertEqual(retry_after_seconds({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}), 10.0)
+        now = 1_700_000_000.0
+        self.assertEqual(retry_after_seconds({"X-RateLimit-Remaining": "0",
+                                              "X-RateLimit-Reset": str(int(now) + 30)}, now=now), 30.0)
+        self.assertIsNone(retry_after_seconds({}))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=50, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            self.assertEqual(bucket.acquire(), 0)
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.08)
+        self.assertEqual(bucket.stats()["acquired"], 10)
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 20 tokens at 100/s with a burst of 1 take at least ~0.19s
+        self.assertGreaterEqual(time.monotonic() - start, 0.17)
+
+    def test_timeout_rejects_without_using_token(self):
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket.acquire()
+        with self.assertRaises(RateLimitExceeded):
+            bucket.acquire(timeout=0.1)
+        self.assertEqual(bucket.stats()["rejected"], 1)
+
+    def test_observe_pauses_on_429(self):
+        bucket = TokenBucket(rate=1000, burst=10)
+        self.assertEqual(bucket.observe(429, {"Retry-After": "0.1"}), 0.1)
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+        self.assertIsNone(bucket.observe(200, {}))
+
+
+@unittest.skipIf(os.name != "posix", "file-locked buckets need fcntl")
+class TestFileTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def test_state_shared_through_file(self):
+        path = os.path.join(self.state_dir, "api.bucket")
+        first = FileTokenBucket(rate=1, burst=2, path=path)
+        second = FileTokenBucket(rate=1, burst=2, path=path)
+        first.acquire()
+        second.acquire()
+        with self.assertRaises(RateLimitExceeded):
+            first.acquire(timeout=0.1)
+
+    def test_registry_creates_process_shared_bucket(self):
+        registry = LimiterRegistry()
+        bucket = registry.get("api.example.com", {"requests_per_second": 5, "shared": "process",
+                                                  "state_dir": self.state_dir})
+        self.assertIsInstance(bucket, FileTokenBucket)
+        self.assertIs(registry.get("api.example.com", {}), bucket)
+        self.assertIn("api.example.com", registry.stats())
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+class TestTransportRateLimit(unittest.TestCase):
+    def test_retries_429_after_retry_after(self):
+        transport = HttpTransport(rate_limit_config={"enabled": True, "requests_per_second": 1000,
+                                                     "retry_on_429": 1})
+        transport._session = FakeSession([FakeResponse(429, {"Retry-After": "0.05"}), FakeResponse(200)])
+        start = time.monotonic()
+        response = transport.get("https://ratelimit-retry.example.com/items", params={"q": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(transport._session.calls), 2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_gives_up_after_retries(self):
+        transport = HttpTransport(rate_limit_config={"enabled": True, "requests_per_second": 1000,
+                                                     "retry_on_429": 0})
+        transport._session = FakeSession([FakeResponse(429, {"Retry-After": "0"})])
+        self.assertEqual(transport.get("https://ratelimit-giveup.example.com/").status_code, 429)
+
+
+if __name__ == "__main__":
+    unittest.main()
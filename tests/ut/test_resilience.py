@@ -0,0 +1,83 @@
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.resilience import (BreakerRegistry, CircuitBreaker, CircuitOpenError,
+                                           DeadlineExceeded, current_deadline, deadline_scope,
+                                           remaining_time)
+
+
+class TestDeadline(unittest.TestCase):
+    def test_scope_sets_and_restores_deadline(self):
+        self.assertIsNone(current_deadline())
+        self.assertEqual(remaining_time(5), 5)
+        with deadline_scope(10):
+            self.assertLessEqual(remaining_time(), 10)
+            self.assertLessEqual(remaining_time(3), 3)
+        self.assertIsNone(current_deadline())
+
+    def test_inner_scope_keeps_earlier_deadline(self):
+        with deadline_scope(1) as outer:
+            with deadline_scope(60) as inner:
+                self.assertIs(inner, outer)
+            with deadline_scope(0.5) as inner:
+                self.assertIsNot(inner, outer)
+            self.assertIs(current_deadline(), outer)
+
+    def test_expired_deadline_raises(self):
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with self.assertRaises(DeadlineExceeded):
+                remaining_time()
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout_seconds=60)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        breaker.record_success()  # resets the consecutive count
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        stats = breaker.stats()
+        self.assertEqual(stats["opened"], 1)
+        self.assertEqual(stats["rejected"], 1)
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.05)
+        breaker.before_call()
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.before_call()  # the probe
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_call()
+
+    def test_registry_shares_breaker_per_upstream(self):
+        registry = BreakerRegistry()
+        breaker = registry.get("api.example.com", {"failure_threshold": 2})
+        self.assertIs(registry.get("api.example.com"), breaker)
+        self.assertIsNot(registry.get("other.example.com"), breaker)
+        self.assertEqual(breaker.failure_threshold, 2)
+        self.assertEqual(registry.stats()["api.example.com"]["state"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_key_is_order_independent(self):
+        self.assertEqual(ResponseCache.make_key({"a": 1, "b": [1, 2]}),
+                         ResponseCache.make_key({"b": [1, 2], "a": 1}))
+
+    def test_hit_and_miss(self):
+        cache = ResponseCache(ttl_seconds=60)
+        calls = []
+        fn = lambda: calls.append(1) or {"temp": 20}
+        self.assertEqual(cache.get_or_call({"city": "London"}, fn), {"temp": 20})
+        self.assertEqual(cache.get_or_call({"city": "London"}, fn), {"temp": 20})
+        self.assertEqual(len(calls), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl_seconds=0.01)
+        calls = []
+        fn = lambda: calls.append(1) or len(calls)
+        cache.get_or_call({}, fn)
+        time.sleep(0.02)
+        self.assertEqual(cache.get_or_call({}, fn), 2)
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.get_or_call({"k": key}, lambda: key)
+        cache.get_or_call({"k": "a"}, lambda: "unused")  # refresh recency of "a"
+        cache.get_or_call({"k": "c"}, lambda: "c")
+        self.assertEqual(cache.get_or_call({"k": "a"}, lambda: "reloaded"), "a")
+        self.assertEqual(cache.get_or_call({"k": "b"}, lambda: "reloaded"), "reloaded")
+        self.assertGreaterEqual(cache.stats()["evictions"], 1)
+
+    def test_error_results_not_cached(self):
+        cache = ResponseCache()
+        cache.get_or_call({}, lambda: {"error": "boom"})
+        self.assertEqual(cache.get_or_call({}, lambda: {"ok": True}), {"ok": True})
+
+    def test_exceptions_propagate(self):
+        cache = ResponseCache()
+        with self.assertRaises(RuntimeError):
+            cache.get_or_call({}, lambda: (_ for _ in ()).throw(RuntimeError("upstream down")))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_single_flight(self):
+        cache = ResponseCache()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            release.wait(2)
+            return {"value": 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_call({"q": 1}, slow_call)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"value": 42}] * 5)
+        self.assertEqual(cache.stats()["coalesced"], 4)
+
+    def test_stale_while_revalidate(self):
+        cache = ResponseCache(ttl_seconds=0.2, stale_while_revalidate_seconds=5)
+        cache.get_or_call({}, lambda: "old")
+        time.sleep(0.25)
+        refreshed = threading.Event()
+
+        def refresh():
+            refreshed.set()
+            return "new"
+
+        self.assertEqual(cache.get_or_call({}, refresh), "old")
+        self.assertTrue(refreshed.wait(2))
+        time.sleep(0.02)
+        self.assertEqual(cache.get_or_call({}, lambda: "miss"), "new")
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+
+    def test_from_config(self):
+        self.assertIsNone(ResponseCache.from_config(None))
+        self.assertIsNone(ResponseCache.from_config({"enabled": False}))
+        cache = ResponseCache.from_config({"enabled": True, "ttl_seconds": 5, "max_entries": 3})
+        self.assertEqual((cache.ttl_seconds, cache.max_entries), (5.0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
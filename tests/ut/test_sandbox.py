@@ -0,0 +1,37 @@
+import unittest
+import sys
+import shutil
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.output_generator import OutputGenerator
+from utils.sandbox import Sandbox
+
+
+class TestSandboxProfile(unittest.TestCase):
+    def setUp(self):
+        self.tool_file = "tests/tmp/profiled/demotool/tool.py"
+        OutputGenerator().generate_tool_class(
+            "DemoTool", "Demo tool", {"city": {"type": "string", "required": True}}, {}, "", self.tool_file,
+            {"api_type": "python_package", "package_name": "builtins",
+             "main_function": {"name": "dict", "import_statement": "from builtins import dict"}})
+
+    def tearDown(self):
+        shutil.rmtree("tests/tmp/profiled", ignore_errors=True)
+
+    def test_profile_tool_measures_import_and_validate(self):
+        performance = Sandbox().profile_tool(self.tool_file, "DemoTool", {"city": "Oslo"}, iterations=100)
+        self.assertGreater(performance["import_ms"], 0)
+        self.assertGreater(performance["validate_us"], 0)
+        self.assertEqual(performance["validate_iterations"], 100)
+
+    def test_profile_tool_reports_missing_class(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            Sandbox().profile_tool(self.tool_file, "MissingTool")
+        self.assertIn("MissingTool", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
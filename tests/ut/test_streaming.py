@@ -0,0 +1,95 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.streaming import (build_projected, project, projection_from_paths,
+                                          projection_from_schema, read_json)
+
+
+def basic_events(value):
+    """Produce the (event, value) pairs ijson.basic_parse emits for value"""
+    if isinstance(value, dict):
+        yield "start_map", None
+        for key, item in value.items():
+            yield "map_key", key
+            yield from basic_events(item)
+        yield "end_map", None
+    elif isinstance(value, list):
+        yield "start_array", None
+        for item in value:
+            yield from basic_events(item)
+        yield "end_array", None
+    elif value is None:
+        yield "null", None
+    elif isinstance(value, bool):
+        yield "boolean", value
+    elif isinstance(value, str):
+        yield "string", value
+    else:
+        yield "number", value
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.body = {
+            "count": 3,
+            "debug": {"trace": [1, 2, 3], "host": "api-1"},
+            "flights": [
+                {"price": 100, "carrier": {"code": "BA", "name": "British"}, "legs": [{"from": "LHR"}]},
+                {"price": 200, "carrier": {"code": "LH", "name": "Lufthansa"}, "legs": []},
+                {"price": 300, "carrier": None, "legs": [{"from": "FRA"}, {"from": "MUC"}]},
+            ]
+        }
+
+    def test_projection_from_schema(self):
+        schema = {"type": "object", "properties": {
+            "flights": {"type": "array", "items": {"type": "object", "properties": {
+                "price": {"type": "number"}, "carrier": {"type": "object"}}}},
+            "count": {"type": "integer"}}}
+        self.assertEqual(projection_from_schema(schema),
+                         {"flights": {"price": None, "carrier": None}, "count": None})
+        self.assertIsNone(projection_from_schema({"type": "object"}))
+
+    def test_projection_from_paths(self):
+        self.assertEqual(projection_from_paths(["flights[].price", "flights.carrier.code", "count"]),
+                         {"flights": {"price": None, "carrier": {"code": None}}, "count": None})
+        # A shorter path keeps the whole subtree
+        self.assertEqual(projection_from_paths(["flights", "flights.price"]), {"flights": None})
+
+    def test_project_parsed_value(self):
+        projection = projection_from_paths(["flights.price", "flights.carrier.code"])
+        self.assertEqual(project(self.body, projection, max_items=2), {"flights": [
+            {"price": 100, "carrier": {"code": "BA"}},
+            {"price": 200, "carrier": {"code": "LH"}},
+        ]})
+
+    def test_streamed_build_matches_project(self):
+        for paths in (["flights.price", "flights.carrier.code"], ["count", "debug"], ["flights.legs"]):
+            projection = projection_from_paths(paths)
+            for max_items in (None, 0, 1, 2):
+                self.assertEqual(build_projected(basic_events(self.body), projection, max_items),
+                                 project(self.body, projection, max_items), (paths, max_items))
+
+    def test_streamed_build_without_projection(self):
+        self.assertEqual(build_projected(basic_events(self.body)), self.body)
+        self.assertEqual(build_projected(basic_events([1, [2, 3], {"a": None}]), max_items=1), [1])
+        self.assertEqual(build_projected(basic_events("scalar")), "scalar")
+
+    def test_read_json_fallback_projects(self):
+        result = read_json(FakeResponse(self.body), projection_from_paths(["count"]), stream=False)
+        self.assertEqual(result, {"count": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
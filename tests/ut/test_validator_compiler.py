@@ -0,0 +1,105 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.validator_compiler import ValidatorCompiler
+
+FLIGHT_SCHEMA = {
+    "flight_data": {
+        "type": "array",
+        "required": True,
+        "class_structure": {
+            "date": "string - Flight date in YYYY-MM-DD format",
+            "from_airport": "string - 3-letter departure airport code",
+            "to_airport": "string - 3-letter arrival airport code"
+        }
+    },
+    "trip": {"type": "string", "required": True, "enum": ["one-way", "round-trip"]},
+    "passengers": {
+        "type": "object",
+        "required": True,
+        "class_structure": {
+            "adults": "integer - Number of adult passengers",
+            "children": "integer - Number of child passengers"
+        }
+    },
+    "max_stops": {"type": "integer", "required": False, "minimum": 0, "maximum": 3},
+    "nonstop": {"type": "boolean", "required": False},
+    "airline": {"type": "string", "required": False, "pattern": "^[A-Z0-9]{2}$"}
+}
+
+VALID_PARAMS = {
+    "flight_data": [{"date": "2025-01-01", "from_airport": "TPE", "to_airport": "MYJ"}],
+    "trip": "one-way",
+    "passengers": {"adults": 2, "children": 0}
+}
+
+
+class TestValidatorCompiler(unittest.TestCase):
+    def setUp(self):
+        self.validate = ValidatorCompiler().compile(FLIGHT_SCHEMA)
+
+    def test_valid_params(self):
+        self.assertEqual(self.validate(VALID_PARAMS), [])
+
+    def test_missing_required(self):
+        errors = self.validate({})
+        self.assertEqual({e["path"] for e in errors}, {"flight_data", "trip", "passengers"})
+        self.assertTrue(all(e["message"] == "is required" for e in errors))
+
+    def test_non_dict_params(self):
+        self.assertEqual(self.validate([]), [{"path": "", "message": "expected object, got list"}])
+
+    def test_enum_and_scalar_types(self):
+        params = dict(VALID_PARAMS, trip="multi-city", max_stops=True, nonstop="yes", airline="lufthansa")
+        errors = {e["path"]: e["message"] for e in self.validate(params)}
+        self.assertEqual(errors["trip"], "must be one of: one-way, round-trip")
+        self.assertEqual(errors["max_stops"], "expected integer, got bool")
+        self.assertEqual(errors["nonstop"], "expected boolean, got str")
+        self.assertIn("does not match pattern", errors["airline"])
+
+    def test_numeric_bounds(self):
+        errors = self.validate(dict(VALID_PARAMS, max_stops=4))
+        self.assertEqual(errors, [{"path": "max_stops", "message": "must be <= 3"}])
+
+    def test_class_structure_checked_recursively(self):
+        params = dict(VALID_PARAMS,
+                      flight_data=[{"date": 20250101, "from_airport": "TPE"}, "TPE-MYJ"],
+                      passengers={"adults": "2"})
+        errors = {e["path"]: e["message"] for e in self.validate(params)}
+        self.assertEqual(errors["flight_data[0].date"], "expected string, got int")
+        self.assertEqual(errors["flight_data[0].to_airport"], "is required")
+        self.assertEqual(errors["flight_data[1]"], "expected object, got str")
+        self.assertEqual(errors["passengers.adults"], "expected integer, got str")
+        self.assertNotIn("passengers.children", errors)
+
+    def test_empty_required_array(self):
+        errors = self.validate(dict(VALID_PARAMS, flight_data=[]))
+        self.assertEqual(errors, [{"path": "flight_data", "message": "must not be empty"}])
+
+    def test_json_schema_items_and_properties(self):
+        validate = ValidatorCompiler().compile({
+            "tags": {"type": "array", "required": False, "items": {"type": "string"}},
+            "location": {
+                "type": "object",
+                "properties": {"lat": {"type": "number"}, "lon": {"type": "number"}},
+                "required": ["lat"]
+            }
+        })
+        errors = validate({"tags": ["a", 1], "location": {"lon": 1.5}})
+        self.assertEqual(errors, [
+            {"path": "tags[1]", "message": "expected string, got int"},
+            {"path": "location.lat", "message": "is required"}
+        ])
+
+    def test_generated_source_uses_frozensets(self):
+        source = ValidatorCompiler().generate_source(FLIGHT_SCHEMA)
+        self.assertIn("frozenset({'one-way', 'round-trip'})", source)
+        self.assertIn("re.compile(", source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from generators.runtime.workers import WorkerPool, WorkerCrashedError
+
+TOOL_MODULE = '''
+import os
+import time
+
+def call_pid():
+    return os.getpid()
+
+def call_echo(**kwargs):
+    print("tool output must not corrupt the reply channel")
+    return kwargs
+
+def call_sleep(seconds):
+    time.sleep(seconds)
+    return "slept"
+
+def call_crash():
+    os._exit(3)
+
+def call_raise():
+    raise ValueError("bad input")
+'''
+
+
+class TestWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.tool_file = os.path.join(cls.tmpdir.name, "tool.py")
+        with open(cls.tool_file, "w") as f:
+            f.write(TOOL_MODULE)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.pool = WorkerPool(self.tool_file, pool_size=2, max_calls_per_worker=3, timeout_seconds=10)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_call_runs_out_of_process(self):
+        self.assertEqual(self.pool.call("call_echo", {"route": ["TPE", "MYJ"]}), {"route": ["TPE", "MYJ"]})
+        self.assertNotEqual(self.pool.call("call_pid", {}), os.getpid())
+
+    def test_workers_recycled_after_max_calls(self):
+        pids = [self.pool.call("call_pid", {}) for _ in range(6)]
+        self.assertEqual(len(set(pids)), 2)
+        self.assertNotEqual(set(pids), {self.pool.call("call_pid", {}) for _ in range(2)})
+        self.assertGreaterEqual(self.pool.stats()["recycled"], 2)
+
+    def test_timeout_kills_worker(self):
+        with self.assertRaises(TimeoutError):
+            self.pool.call("call_sleep", {"seconds": 5}, timeout=0.2)
+        self.assertEqual(self.pool.call("call_sleep", {"seconds": 0}), "slept")
+        self.assertEqual(self.pool.stats()["timeouts"], 1)
+
+    def test_crash_is_replaced(self):
+        with self.assertRaises(WorkerCrashedError):
+            self.pool.call("call_crash", {})
+        self.assertEqual(self.pool.call("call_echo", {}), {})
+        self.assertEqual(self.pool.stats()["crashes"], 1)
+
+    def test_function_error_propagates(self):
+        with self.assertRaises(RuntimeError) as ctx:
+            self.pool.call("call_raise", {})
+        self.assertIn("ValueError: bad input", str(ctx.exception))
+
+    def test_from_config(self):
+        self.assertIsNone(WorkerPool.from_config(self.tool_file, {"enabled": False}))
+        pool = WorkerPool.from_config(self.tool_file, {"enabled": True, "pool_size": 3})
+        self.assertEqual(pool.pool_size, 3)
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()